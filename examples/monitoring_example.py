@@ -7,10 +7,23 @@ and debugging capabilities of the MCP server.
 """
 
 import asyncio
+import itertools
 import json
 import os
 import sys
-from typing import Dict, Any
+from typing import Dict, Any, List
+
+# orjson is optional; it serializes requests straight to UTF-8 bytes and
+# parses responses faster than the standard library
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Upper bound for one server response or pipe operation; a stuck server
+# makes the example fail instead of hanging
+RESPONSE_TIMEOUT = 30.0
 
 # Configure UTF-8 encoding for Windows console output
 if sys.platform == "win32":
@@ -26,7 +39,7 @@ class MCPClient:
     def __init__(self, server_script="../regon_mcp_server/server.py"):
         self.server_script = server_script
         self.process = None
-        self.id_counter = 0
+        self._ids = itertools.count(1)
     
     async def start_server(self):
         """Start the MCP server process."""
@@ -34,7 +47,8 @@ class MCPClient:
             sys.executable, self.server_script,
             stdin=asyncio.subprocess.PIPE,
             stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
+            stderr=asyncio.subprocess.PIPE,
+            limit=2 ** 20  # full reports can exceed the default 64 KiB line limit
         )
         print("🚀 MCP Server started")
     
@@ -42,34 +56,49 @@ class MCPClient:
         """Stop the MCP server process."""
         if self.process:
             self.process.terminate()
-            await self.process.wait()
+            try:
+                await asyncio.wait_for(self.process.wait(), RESPONSE_TIMEOUT)
+            except asyncio.TimeoutError:
+                self.process.kill()
+                await self.process.wait()
             print("⏹️  MCP Server stopped")
     
     async def send_request(self, method: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
         """Send a JSON-RPC request to the server."""
-        self.id_counter += 1
-        request = {
+        await self.send_batch([self._next_request(method, params)])
+        return await self._read_response()
+    
+    def _next_request(self, method: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Build a JSON-RPC request with the next request id."""
+        return {
             "jsonrpc": "2.0",
-            "id": self.id_counter,
+            "id": next(self._ids),
             "method": method,
             "params": params or {}
         }
-        
-        message = json.dumps(request) + "\n"
-        self.process.stdin.write(message.encode())
-        await self.process.stdin.drain()
-        
-        # Read response
-        line = await self.process.stdout.readline()
+    
+    async def send_batch(self, messages: List[Dict[str, Any]]):
+        """Send several JSON-RPC messages with a single write and drain."""
+        if ORJSON_AVAILABLE:
+            payload = b"".join(orjson.dumps(m) + b"\n" for m in messages)
+        else:
+            payload = "".join(json.dumps(m) + "\n" for m in messages).encode()
+        self.process.stdin.write(payload)
+        await asyncio.wait_for(self.process.stdin.drain(), RESPONSE_TIMEOUT)
+    
+    async def _read_response(self) -> Dict[str, Any]:
+        """Read one JSON-RPC response line from the server."""
+        line = await asyncio.wait_for(self.process.stdout.readline(), RESPONSE_TIMEOUT)
         if line:
-            return json.loads(line.decode().strip())
+            # Parse the bytes as read, without a decode/strip copy
+            return orjson.loads(line) if ORJSON_AVAILABLE else json.loads(line)
         else:
             stderr = await self.process.stderr.read()
             raise Exception(f"No response received. Stderr: {stderr.decode()}")
     
     async def initialize(self):
         """Initialize the MCP session."""
-        response = await self.send_request("initialize", {
+        request = self._next_request("initialize", {
             "protocolVersion": "2024-11-05",
             "capabilities": {},
             "clientInfo": {
@@ -78,15 +107,15 @@ class MCPClient:
             }
         })
         
-        # Send initialized notification (required after initialize)
+        # The initialized notification (required after initialize) goes out
+        # in the same write as the request
         initialized_msg = {
             "jsonrpc": "2.0",
             "method": "notifications/initialized"
         }
         
-        message = json.dumps(initialized_msg) + "\n"
-        self.process.stdin.write(message.encode())
-        await self.process.stdin.drain()
+        await self.send_batch([request, initialized_msg])
+        response = await self._read_response()
         
         print("✅ Initialized MCP session")
         return response
@@ -12,12 +12,48 @@ import functools
 import asyncio
 import sys
 import json
+import re
+import time
 from typing import Any, Dict, List, Optional, Callable, Union
 from mcp.types import TextContent
 
+# orjson is optional; fall back to the standard library when it is missing
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 # Configure module logger
 logger = logging.getLogger(__name__)
 
+# Minimum number of seconds between two error logs carrying a full traceback
+TRACEBACK_LOG_INTERVAL = 5.0
+_last_traceback_log = 0.0
+
+def traceback_due(interval: float = TRACEBACK_LOG_INTERVAL) -> bool:
+    """
+    Decide whether the current error log should include a traceback.
+    
+    Formatting a traceback walks every frame and reads source lines, which
+    adds up when every request fails (e.g. during a REGON outage). Use as
+    ``logger.error(msg, exc_info=traceback_due())`` to keep at most one
+    traceback per interval while still logging every error message.
+    
+    Args:
+        interval: Minimum number of seconds between tracebacks
+        
+    Returns:
+        True if a traceback should be logged now
+    """
+    global _last_traceback_log
+    now = time.monotonic()
+    if now - _last_traceback_log >= interval:
+        _last_traceback_log = now
+        return True
+    return False
+
 class ServerError(Exception):
     """Base exception for server errors."""
     def __init__(self, message: str, error_code: str = "UNKNOWN_ERROR", details: Optional[Dict] = None):
@@ -62,7 +98,7 @@ def safe_execute(func: Callable) -> Callable:
             return func(*args, **kwargs)
         except Exception as e:
             error_msg = f"Error in {func.__name__}: {str(e)}"
-            logger.error(error_msg, exc_info=True)
+            logger.error(error_msg, exc_info=traceback_due())
             
             # Return safe default based on function name
             if func.__name__.startswith('get_') or func.__name__.startswith('load_'):
@@ -95,7 +131,7 @@ def safe_async_execute(func: Callable) -> Callable:
             raise
         except Exception as e:
             error_msg = f"Error in {func.__name__}: {str(e)}"
-            logger.error(error_msg, exc_info=True)
+            logger.error(error_msg, exc_info=traceback_due())
             
             # Return safe default for async functions
             if func.__name__.startswith('handle_'):
@@ -109,23 +145,78 @@ def safe_async_execute(func: Callable) -> Callable:
                 
     return wrapper
 
-def safe_json_parse(data: str, default: Any = None) -> Any:
+def tool_error_handler(context: str) -> Callable:
+    """
+    Decorator converting exceptions raised by an async tool handler into
+    a standardized MCP error response.
+    
+    Stack it below retry decorators so the retry wrapper sees the same
+    return values as with an inline try/except.
+    
+    Args:
+        context: Description of the operation used in the error response
+        
+    Returns:
+        Decorator for async tool handlers
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                return create_error_response(e, context)
+        
+        return wrapper
+    
+    return decorator
+
+def safe_json_parse(data: Union[str, bytes], default: Any = None) -> Any:
     """
     Safely parse JSON data with error handling.
     
+    Uses orjson when available, which accepts both str and bytes input.
+    
     Args:
-        data: JSON string to parse
+        data: JSON string or bytes to parse
         default: Default value if parsing fails
         
     Returns:
         Parsed JSON data or default value
     """
     try:
+        if ORJSON_AVAILABLE:
+            return orjson.loads(data)
         return json.loads(data)
     except (json.JSONDecodeError, TypeError) as e:
         logger.warning(f"JSON parsing failed: {e}")
         return default
 
+# Shared encoder for the stdlib fallback. REGON responses are plain trees of
+# dicts and lists, so the circular reference check is skipped.
+_JSON_ENCODE = json.JSONEncoder(indent=2, ensure_ascii=False, check_circular=False).encode
+
+def format_json(data: Any) -> str:
+    """
+    Serialize data as indented JSON text, keeping non-ASCII characters.
+    
+    Produces the same output as ``json.dumps(data, indent=2, ensure_ascii=False)``,
+    using orjson when available and a preallocated encoder otherwise.
+    
+    Args:
+        data: JSON-serializable data
+        
+    Returns:
+        Indented JSON string
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8')
+        except TypeError:
+            # Types orjson does not handle natively go through the stdlib encoder
+            pass
+    return _JSON_ENCODE(data)
+
 def safe_dict_get(dictionary: Dict, key: str, default: Any = None) -> Any:
     """
     Safely get value from dictionary with nested key support.
@@ -150,13 +241,25 @@ def safe_dict_get(dictionary: Dict, key: str, default: Any = None) -> Any:
     except (KeyError, TypeError, AttributeError):
         return default
 
-def validate_input(data: Dict, required_fields: List[str], field_types: Optional[Dict[str, type]] = None) -> Dict[str, Any]:
+# Identifier formats accepted by validate_input(value, kind), compiled once
+_VALIDATORS = {
+    'nip': re.compile(r'[0-9]{10}'),
+    'regon9': re.compile(r'[0-9]{9}'),
+    'regon14': re.compile(r'[0-9]{14}'),
+    'regon': re.compile(r'[0-9]{9}(?:[0-9]{5})?'),
+    'krs': re.compile(r'[0-9]{10}'),
+}
+
+def validate_input(data: Any, required_fields: Union[List[str], str], field_types: Optional[Dict[str, type]] = None) -> Any:
     """
     Validate input data with type checking.
     
+    Passing an identifier kind ('nip', 'regon9', 'regon14', 'regon' or 'krs')
+    instead of a field list validates a single identifier string.
+    
     Args:
         data: Input data to validate
-        required_fields: List of required field names
+        required_fields: List of required field names, or an identifier kind
         field_types: Optional type validation for fields
         
     Returns:
@@ -165,6 +268,14 @@ def validate_input(data: Dict, required_fields: List[str], field_types: Optional
     Raises:
         ValidationError: If validation fails
     """
+    if isinstance(required_fields, str):
+        pattern = _VALIDATORS.get(required_fields)
+        if pattern is None:
+            raise ValidationError(f"Unknown identifier kind: {required_fields}")
+        if not isinstance(data, str) or pattern.fullmatch(data) is None:
+            raise ValidationError(f"Invalid {required_fields.upper()} format", {"value": data})
+        return data
+    
     if not isinstance(data, dict):
         raise ValidationError("Input must be a dictionary")
     
@@ -181,6 +292,39 @@ def validate_input(data: Dict, required_fields: List[str], field_types: Optional
     
     return data
 
+def make_validator(required_fields: List[str], field_types: Optional[Dict[str, type]] = None) -> Callable[[Dict], Dict[str, Any]]:
+    """
+    Build an input validator specialized for a fixed schema.
+    
+    The returned function behaves like validate_input() with the same
+    arguments, but the schema is unpacked once instead of on every call.
+    
+    Args:
+        required_fields: List of required field names
+        field_types: Optional type validation for fields
+        
+    Returns:
+        Function validating a data dictionary against the schema
+    """
+    required = tuple(required_fields)
+    typed = tuple((field_types or {}).items())
+    
+    def validator(data: Dict) -> Dict[str, Any]:
+        if not isinstance(data, dict):
+            raise ValidationError("Input must be a dictionary")
+        
+        missing_fields = [field for field in required if field not in data]
+        if missing_fields:
+            raise ValidationError(f"Missing required fields: {missing_fields}")
+        
+        for field, expected_type in typed:
+            if field in data and not isinstance(data[field], expected_type):
+                raise ValidationError(f"Field '{field}' must be of type {expected_type.__name__}")
+        
+        return data
+    
+    return validator
+
 def sanitize_string(value: str, max_length: int = 1000) -> str:
     """
     Sanitize string input to prevent injection attacks and limit length.
@@ -276,20 +420,23 @@ class RetryMechanism:
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             last_exception = None
+            # Read the settings once per call rather than on every attempt
+            max_retries = self.max_retries
+            wait_time = self.delay
+            backoff_factor = self.backoff_factor
             
-            for attempt in range(self.max_retries + 1):
+            for attempt in range(max_retries + 1):
                 try:
                     return func(*args, **kwargs)
                 except Exception as e:
                     last_exception = e
                     
-                    if attempt < self.max_retries:
-                        wait_time = self.delay * (self.backoff_factor ** attempt)
+                    if attempt < max_retries:
                         logger.warning(f"Attempt {attempt + 1} failed for {func.__name__}: {e}. Retrying in {wait_time}s...")
-                        import time
                         time.sleep(wait_time)
+                        wait_time *= backoff_factor
                     else:
-                        logger.error(f"All {self.max_retries + 1} attempts failed for {func.__name__}")
+                        logger.error(f"All {max_retries + 1} attempts failed for {func.__name__}")
                         break
             
             raise last_exception
@@ -300,19 +447,23 @@ class RetryMechanism:
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
             last_exception = None
+            # Read the settings once per call rather than on every attempt
+            max_retries = self.max_retries
+            wait_time = self.delay
+            backoff_factor = self.backoff_factor
             
-            for attempt in range(self.max_retries + 1):
+            for attempt in range(max_retries + 1):
                 try:
                     return await func(*args, **kwargs)
                 except Exception as e:
                     last_exception = e
                     
-                    if attempt < self.max_retries:
-                        wait_time = self.delay * (self.backoff_factor ** attempt)
+                    if attempt < max_retries:
                         logger.warning(f"Attempt {attempt + 1} failed for {func.__name__}: {e}. Retrying in {wait_time}s...")
                         await asyncio.sleep(wait_time)
+                        wait_time *= backoff_factor
                     else:
-                        logger.error(f"All {self.max_retries + 1} attempts failed for {func.__name__}")
+                        logger.error(f"All {max_retries + 1} attempts failed for {func.__name__}")
                         break
             
             raise last_exception
@@ -19,11 +19,14 @@ import asyncio
 import json
 import logging
 import os
+import re
 import sys
 import time
 import signal
+import threading
 import traceback
-from typing import Any, Dict, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
 
 from dotenv import load_dotenv
 from mcp.server import Server
@@ -58,20 +61,22 @@ def app_dir() -> Path:
 
 # Try relative import first, fall back to direct import
 try:
-    from .tool_config import get_config_loader
+    from .tool_config import get_config_loader, _canonical_name
     from .error_handling import (
         safe_execute, safe_async_execute, ServerError, ConfigurationError,
         APIError, ValidationError, NetworkError, create_error_response,
         setup_error_handling, retry_on_failure, retry_on_network_failure,
-        health_checker, validate_input, sanitize_string, format_error_for_user
+        health_checker, validate_input, make_validator, sanitize_string, format_error_for_user,
+        traceback_due, tool_error_handler, format_json
     )
 except ImportError:
-    from tool_config import get_config_loader
+    from tool_config import get_config_loader, _canonical_name
     from error_handling import (
         safe_execute, safe_async_execute, ServerError, ConfigurationError,
         APIError, ValidationError, NetworkError, create_error_response,
         setup_error_handling, retry_on_failure, retry_on_network_failure,
-        health_checker, validate_input, sanitize_string, format_error_for_user
+        health_checker, validate_input, make_validator, sanitize_string, format_error_for_user,
+        traceback_due, tool_error_handler, format_json
     )
 
 # Configure UTF-8 encoding for proper Polish character handling
@@ -110,6 +115,7 @@ config = {
 
 # Global variables
 regon_api = None
+_regon_api_lock = threading.Lock()
 tool_config_loader = None
 server_info = None
 
@@ -129,9 +135,38 @@ AVAILABLE_REPORTS = [
     "BIR11TypPodmiotu"
 ]
 
+# Input validators for the tool handlers, specialized once per schema
+_validate_nip_args = make_validator(["nip"], {"nip": str})
+_validate_regon_args = make_validator(["regon"], {"regon": str})
+_validate_krs_args = make_validator(["krs"], {"krs": str})
+_validate_nips_args = make_validator(["nips"], {"nips": list})
+_validate_regons_args = make_validator(["regons"], {"regons": list})
+_validate_krs_numbers_args = make_validator(["krs_numbers"], {"krs_numbers": list})
+_validate_full_report_args = make_validator(["regon", "report_name"], {"regon": str, "report_name": str})
+
+# Identifier normalization: drop the separators people type into NIP/REGON/KRS
+# numbers (e.g. "734-286-71-48") in one pass, then match the whole string
+_IDENTIFIER_STRIP_TABLE = str.maketrans('', '', ' -\t\r\n')
+_NIP_MATCH = re.compile(r'[0-9]{10}').fullmatch
+_KRS_MATCH = re.compile(r'[0-9]{10}').fullmatch
+_REGON9_MATCH = re.compile(r'[0-9]{9}').fullmatch
+_REGON_MATCH = re.compile(r'[0-9]{9}(?:[0-9]{5})?').fullmatch
+
+# Status indicators shared by the status handlers
+_EMOJI_GREEN = "🟢"
+_EMOJI_RED = "🔴"
+
 @safe_execute
-def parse_arguments():
-    """Parse command line arguments with error handling."""
+def parse_arguments(argv: Optional[List[str]] = None):
+    """
+    Parse command line arguments with error handling.
+    
+    Args:
+        argv: Arguments to parse instead of sys.argv, e.g. from tests
+        
+    Returns:
+        Parsed arguments, or safe defaults if parsing fails
+    """
     try:
         parser = argparse.ArgumentParser(
             description='RegonAPI MCP Server',
@@ -172,7 +207,7 @@ Environment Variables:
             help='Tool configuration to use (default, polish, minimal, detailed). Uses TOOLS_CONFIG env var if not specified.'
         )
         
-        return parser.parse_args()
+        return parser.parse_args(argv)
     
     except SystemExit:
         # Handle help/version exits gracefully
@@ -275,7 +310,7 @@ def get_api_key(production_mode: bool) -> str:
 @retry_on_network_failure.async_retry
 async def initialize_regon_api_async(production_mode: bool) -> RegonAPI:
     """Initialize RegonAPI with async retry mechanism."""
-    return initialize_regon_api(production_mode)
+    return await asyncio.to_thread(initialize_regon_api, production_mode)
 
 @safe_execute
 def initialize_regon_api(production_mode: bool) -> RegonAPI:
@@ -283,53 +318,90 @@ def initialize_regon_api(production_mode: bool) -> RegonAPI:
     global regon_api
     
     if regon_api is None:
-        try:
-            api_key = get_api_key(production_mode)
-            
-            logger.info(f"Initializing RegonAPI in {'production' if production_mode else 'test'} mode")
-            
-            # Initialize RegonAPI with appropriate environment
-            regon_api = RegonAPI(
-                bir_version="bir1.1",
-                is_production=production_mode,
-                timeout=30,
-                operation_timeout=30
-            )
-            time.sleep(2)
+        # Handlers initialize the client from worker threads; build it only once
+        with _regon_api_lock:
+            if regon_api is None:
+                try:
+                    api_key = get_api_key(production_mode)
+                    
+                    logger.info(f"Initializing RegonAPI in {'production' if production_mode else 'test'} mode")
+                    
+                    # Initialize RegonAPI with appropriate environment; the client is only
+                    # published to regon_api once it has authenticated successfully
+                    api = RegonAPI(
+                        bir_version="bir1.1",
+                        is_production=production_mode,
+                        timeout=30,
+                        operation_timeout=30
+                    )
+                    configure_connection_pool(api)
+                    time.sleep(2)
 
-            logger.info(f"RegonAPI to be initialized with key {api_key}")
+                    logger.info(f"RegonAPI to be initialized with key {api_key}")
+
+                    # Authenticate with retry mechanism
+                    @retry_on_network_failure
+                    def authenticate():
+                        api.authenticate(key=api_key)
+                        return api.get_service_status()
+                    
+                    status_code, status_message = authenticate()
+                    
+                    # Validate authentication
+                    if status_code != 1:
+                        raise APIError(f"RegonAPI authentication failed: {status_message}")
+                    
+                    regon_api = api
+                    mode_str = "production" if production_mode else "test"
+                    logger.info(f"RegonAPI initialized successfully in {mode_str} mode")
+                    logger.info(f"Service status: {status_message}")
+                    
+                    # Register health check
+                    health_checker.register_check("regon_api", lambda: regon_api.get_service_status())
+                
+                except (ApiAuthenticationError, ApiError) as e:
+                    error_msg = f"RegonAPI authentication failed: {str(e)}"
+                    logger.error(error_msg)
+                    raise APIError(error_msg, {"production_mode": production_mode})
+                
+                except Exception as e:
+                    error_msg = f"Failed to initialize RegonAPI: {str(e)}"
+                    logger.error(error_msg, exc_info=traceback_due())
+                    raise APIError(error_msg, {"production_mode": production_mode})
 
-            # Authenticate with retry mechanism
-            @retry_on_network_failure
-            def authenticate():
-                regon_api.authenticate(key=api_key)
-                return regon_api.get_service_status()
-            
-            status_code, status_message = authenticate()
-            
-            # Validate authentication
-            if status_code != 1:
-                raise APIError(f"RegonAPI authentication failed: {status_message}")
-            
-            mode_str = "production" if production_mode else "test"
-            logger.info(f"RegonAPI initialized successfully in {mode_str} mode")
-            logger.info(f"Service status: {status_message}")
-            
-            # Register health check
-            health_checker.register_check("regon_api", lambda: regon_api.get_service_status())
-            
-        except (ApiAuthenticationError, ApiError) as e:
-            error_msg = f"RegonAPI authentication failed: {str(e)}"
-            logger.error(error_msg)
-            raise APIError(error_msg, {"production_mode": production_mode})
-        
-        except Exception as e:
-            error_msg = f"Failed to initialize RegonAPI: {str(e)}"
-            logger.error(error_msg, exc_info=True)
-            raise APIError(error_msg, {"production_mode": production_mode})
-    
     return regon_api
 
+def reset_regon_api() -> None:
+    """Drop the shared RegonAPI client so the next call re-authenticates."""
+    global regon_api
+    regon_api = None
+
+def configure_connection_pool(api: RegonAPI) -> bool:
+    """Mount a keep-alive connection pool on the SOAP transport session.
+
+    RegonAPI talks to GUS through zeep, whose transport holds a
+    ``requests.Session``. Handlers call the API from worker threads, so the
+    pool is sized for concurrent calls and connections are reused instead
+    of paying a TCP+TLS handshake per request. Retries stay with the
+    server's retry decorators.
+    """
+    try:
+        from requests import Session
+        from requests.adapters import HTTPAdapter
+    except ImportError:
+        return False
+
+    transport = getattr(getattr(api, 'client', None), 'transport', None)
+    session = getattr(transport, 'session', None)
+    if not isinstance(session, Session):
+        logger.debug("RegonAPI transport session not found, using default connection handling")
+        return False
+
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=0)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return True
+
 @safe_execute
 def initialize_tool_config():
     """Initialize tool configuration loader with comprehensive error handling."""
@@ -346,7 +418,7 @@ def initialize_tool_config():
         
         # Validate config name if provided
         if config_name:
-            config_name = sanitize_string(config_name, 50)
+            config_name = _canonical_name(sanitize_string(config_name, 50))
             available_configs = tool_config_loader.list_available_configs()
             if config_name not in available_configs:
                 current_logger.warning(f"Invalid config '{config_name}', available: {available_configs}")
@@ -360,7 +432,7 @@ def initialize_tool_config():
             raise ConfigurationError("Invalid configuration data format")
         
         tools = tool_config_loader.get_all_tools()
-        if not tools or not isinstance(tools, list):
+        if not tools or not isinstance(tools, (list, tuple)):
             raise ConfigurationError("Invalid tools configuration")
         
         # Validate each tool has required fields
@@ -584,376 +656,330 @@ async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[TextCon
         return result
         
     except Exception as e:
-        logger.error(f"Critical error in handle_call_tool: {e}", exc_info=True)
+        logger.error(f"Critical error in handle_call_tool: {e}", exc_info=traceback_due())
         return create_error_response(e, f"Tool: {name}")
 
 async def route_tool_call(name: str, arguments: Dict[str, Any], api: RegonAPI) -> List[TextContent]:
     """Route tool calls to appropriate handlers with error handling."""
     
     try:
-        if name == "regon_search_by_nip":
-            return await handle_search_by_nip(arguments, api)
-        elif name == "regon_search_by_regon":
-            return await handle_search_by_regon(arguments, api)
-        elif name == "regon_search_by_krs":
-            return await handle_search_by_krs(arguments, api)
-        elif name == "regon_search_multiple_nips":
-            return await handle_search_multiple_nips(arguments, api)
-        elif name == "regon_search_multiple_regons9":
-            return await handle_search_multiple_regons9(arguments, api)
-        elif name == "regon_search_multiple_krs":
-            return await handle_search_multiple_krs(arguments, api)
-        elif name == "regon_get_full_report":
-            return await handle_get_full_report(arguments, api)
-        elif name == "regon_get_service_status":
-            return await handle_get_service_status(arguments, api)
-        elif name == "regon_get_data_status":
-            return await handle_get_data_status(arguments, api)
-        elif name == "regon_get_last_error_code":
-            return await handle_get_last_error_code(arguments, api)
-        elif name == "regon_get_last_error_message":
-            return await handle_get_last_error_message(arguments, api)
-        elif name == "regon_get_session_status":
-            return await handle_get_session_status(arguments, api)
-        elif name == "regon_get_available_operations":
-            return await handle_get_available_operations(arguments, api)
-        else:
+        handler = TOOL_HANDLERS.get(name)
+        if handler is None:
             return create_error_response(ValidationError(f"Unknown tool: {name}"))
+        return await handler(arguments, api)
             
     except Exception as e:
-        logger.error(f"Error routing tool call {name}: {e}", exc_info=True)
+        logger.error(f"Error routing tool call {name}: {e}", exc_info=traceback_due())
         return create_error_response(e, f"Tool: {name}")
 
 # Individual tool handlers with comprehensive error handling
 
 @retry_on_network_failure.async_retry
+@tool_error_handler("NIP search")
 async def handle_search_by_nip(arguments: Dict[str, Any], api: RegonAPI) -> List[TextContent]:
     """Handle NIP search with validation and error handling."""
-    try:
-        validate_input(arguments, ["nip"], {"nip": str})
-        nip = arguments["nip"].strip()
-        
-        # Validate NIP format
-        if not nip.isdigit() or len(nip) != 10:
-            return create_error_response(ValidationError("NIP must be exactly 10 digits"))
-        
-        logger.debug(f"Searching by NIP: {nip}")
-        result = api.searchData(nip=nip)
-        
-        if not result:
-            return [TextContent(type="text", text="ℹ️ No data found for the specified NIP number.")]
-        
-        # Transform 'Typ' field values to descriptive Polish text
-        if isinstance(result, list):
-            for item in result:
-                if isinstance(item, dict) and 'Typ' in item:
-                    if item['Typ'] == 'P':
-                        item['Typ'] = "osoba prawna"
-                    elif item['Typ'] == 'F':
-                        item['Typ'] = "osoba fizyczna"
-        
-        return [TextContent(type="text", text=json.dumps(result, indent=2, ensure_ascii=False))]
-        
-    except Exception as e:
-        return create_error_response(e, "NIP search")
+    _validate_nip_args(arguments)
+    nip = arguments["nip"].translate(_IDENTIFIER_STRIP_TABLE)
+    
+    # Validate NIP format
+    if _NIP_MATCH(nip) is None:
+        return create_error_response(ValidationError("NIP must be exactly 10 digits"))
+    
+    logger.debug(f"Searching by NIP: {nip}")
+    result = await asyncio.to_thread(api.searchData, nip=nip)
+    
+    if not result:
+        return [TextContent(type="text", text="ℹ️ No data found for the specified NIP number.")]
+    
+    # Transform 'Typ' field values to descriptive Polish text
+    if isinstance(result, list):
+        for item in result:
+            if isinstance(item, dict) and 'Typ' in item:
+                if item['Typ'] == 'P':
+                    item['Typ'] = "osoba prawna"
+                elif item['Typ'] == 'F':
+                    item['Typ'] = "osoba fizyczna"
+    
+    return [TextContent(type="text", text=format_json(result))]
 
 @retry_on_network_failure.async_retry
+@tool_error_handler("REGON search")
 async def handle_search_by_regon(arguments: Dict[str, Any], api: RegonAPI) -> List[TextContent]:
     """Handle REGON search with validation and error handling."""
-    try:
-        validate_input(arguments, ["regon"], {"regon": str})
-        regon = arguments["regon"].strip()
-        
-        # Validate REGON format
-        if not regon.isdigit() or len(regon) not in [9, 14]:
-            return create_error_response(ValidationError("REGON must be 9 or 14 digits"))
-        
-        logger.debug(f"Searching by REGON: {regon}")
-        result = api.searchData(regon=regon)
-        
-        if not result:
-            return [TextContent(type="text", text="ℹ️ No data found for the specified REGON number.")]
-        
-        # Transform 'Typ' field values to descriptive Polish text
-        if isinstance(result, list):
-            for item in result:
-                if isinstance(item, dict) and 'Typ' in item:
-                    if item['Typ'] == 'P':
-                        item['Typ'] = "osoba prawna"
-                    elif item['Typ'] == 'F':
-                        item['Typ'] = "osoba fizyczna"
-        
-        return [TextContent(type="text", text=json.dumps(result, indent=2, ensure_ascii=False))]
-        
-    except Exception as e:
-        return create_error_response(e, "REGON search")
+    _validate_regon_args(arguments)
+    regon = arguments["regon"].translate(_IDENTIFIER_STRIP_TABLE)
+    
+    # Validate REGON format
+    if _REGON_MATCH(regon) is None:
+        return create_error_response(ValidationError("REGON must be 9 or 14 digits"))
+    
+    logger.debug(f"Searching by REGON: {regon}")
+    result = await asyncio.to_thread(api.searchData, regon=regon)
+    
+    if not result:
+        return [TextContent(type="text", text="ℹ️ No data found for the specified REGON number.")]
+    
+    # Transform 'Typ' field values to descriptive Polish text
+    if isinstance(result, list):
+        for item in result:
+            if isinstance(item, dict) and 'Typ' in item:
+                if item['Typ'] == 'P':
+                    item['Typ'] = "osoba prawna"
+                elif item['Typ'] == 'F':
+                    item['Typ'] = "osoba fizyczna"
+    
+    return [TextContent(type="text", text=format_json(result))]
 
 @retry_on_network_failure.async_retry
+@tool_error_handler("KRS search")
 async def handle_search_by_krs(arguments: Dict[str, Any], api: RegonAPI) -> List[TextContent]:
     """Handle KRS search with validation and error handling."""
-    try:
-        validate_input(arguments, ["krs"], {"krs": str})
-        krs = arguments["krs"].strip()
-        
-        # Validate KRS format
-        if not krs.isdigit() or len(krs) != 10:
-            return create_error_response(ValidationError("KRS must be exactly 10 digits"))
-        
-        logger.debug(f"Searching by KRS: {krs}")
-        result = api.searchData(krs=krs)
-        
-        if not result:
-            return [TextContent(type="text", text="ℹ️ No data found for the specified KRS number.")]
-        
-        # Transform 'Typ' field values to descriptive Polish text
-        if isinstance(result, list):
-            for item in result:
-                if isinstance(item, dict) and 'Typ' in item:
-                    if item['Typ'] == 'P':
-                        item['Typ'] = "osoba prawna"
-                    elif item['Typ'] == 'F':
-                        item['Typ'] = "osoba fizyczna"
-        
-        return [TextContent(type="text", text=json.dumps(result, indent=2, ensure_ascii=False))]
-        
-    except Exception as e:
-        return create_error_response(e, "KRS search")
+    _validate_krs_args(arguments)
+    krs = arguments["krs"].translate(_IDENTIFIER_STRIP_TABLE)
+    
+    # Validate KRS format
+    if _KRS_MATCH(krs) is None:
+        return create_error_response(ValidationError("KRS must be exactly 10 digits"))
+    
+    logger.debug(f"Searching by KRS: {krs}")
+    result = await asyncio.to_thread(api.searchData, krs=krs)
+    
+    if not result:
+        return [TextContent(type="text", text="ℹ️ No data found for the specified KRS number.")]
+    
+    # Transform 'Typ' field values to descriptive Polish text
+    if isinstance(result, list):
+        for item in result:
+            if isinstance(item, dict) and 'Typ' in item:
+                if item['Typ'] == 'P':
+                    item['Typ'] = "osoba prawna"
+                elif item['Typ'] == 'F':
+                    item['Typ'] = "osoba fizyczna"
+    
+    return [TextContent(type="text", text=format_json(result))]
 
 @retry_on_network_failure.async_retry
+@tool_error_handler("Multiple NIP search")
 async def handle_search_multiple_nips(arguments: Dict[str, Any], api: RegonAPI) -> List[TextContent]:
     """Handle multiple NIP search with validation and error handling."""
-    try:
-        validate_input(arguments, ["nips"], {"nips": list})
-        nips = arguments["nips"]
-        
-        if len(nips) > 20:  # Limit to prevent abuse
-            return create_error_response(ValidationError("Maximum 20 NIPs allowed per request"))
-        
-        # Validate each NIP
-        valid_nips = []
-        for nip in nips:
-            nip = str(nip).strip()
-            if nip.isdigit() and len(nip) == 10:
-                valid_nips.append(nip)
-            else:
-                logger.warning(f"Skipping invalid NIP: {nip}")
-        
-        if not valid_nips:
-            return create_error_response(ValidationError("No valid NIPs provided"))
-        
-        logger.debug(f"Searching multiple NIPs: {valid_nips}")
-        result = api.searchData(nips=valid_nips)
-        
-        # Transform 'Typ' field values to descriptive Polish text
-        if isinstance(result, list):
-            for item in result:
-                if isinstance(item, dict) and 'Typ' in item:
-                    if item['Typ'] == 'P':
-                        item['Typ'] = "osoba prawna"
-                    elif item['Typ'] == 'F':
-                        item['Typ'] = "osoba fizyczna"
-        
-        return [TextContent(type="text", text=json.dumps(result, indent=2, ensure_ascii=False))]
-        
-    except Exception as e:
-        return create_error_response(e, "Multiple NIP search")
+    _validate_nips_args(arguments)
+    nips = arguments["nips"]
+    
+    if len(nips) > 20:  # Limit to prevent abuse
+        return create_error_response(ValidationError("Maximum 20 NIPs allowed per request"))
+    
+    # Validate each NIP
+    valid_nips = []
+    for nip in nips:
+        nip = str(nip).translate(_IDENTIFIER_STRIP_TABLE)
+        if _NIP_MATCH(nip) is not None:
+            valid_nips.append(nip)
+        else:
+            logger.warning(f"Skipping invalid NIP: {nip}")
+    
+    if not valid_nips:
+        return create_error_response(ValidationError("No valid NIPs provided"))
+    
+    logger.debug(f"Searching multiple NIPs: {valid_nips}")
+    result = await asyncio.to_thread(api.searchData, nips=valid_nips)
+    
+    # Transform 'Typ' field values to descriptive Polish text
+    if isinstance(result, list):
+        for item in result:
+            if isinstance(item, dict) and 'Typ' in item:
+                if item['Typ'] == 'P':
+                    item['Typ'] = "osoba prawna"
+                elif item['Typ'] == 'F':
+                    item['Typ'] = "osoba fizyczna"
+    
+    return [TextContent(type="text", text=format_json(result))]
 
 @retry_on_network_failure.async_retry
+@tool_error_handler("Multiple REGON search")
 async def handle_search_multiple_regons9(arguments: Dict[str, Any], api: RegonAPI) -> List[TextContent]:
     """Handle multiple REGON9 search with validation and error handling."""
-    try:
-        validate_input(arguments, ["regons"], {"regons": list})
-        regons = arguments["regons"]
-        
-        if len(regons) > 20:  # Limit to prevent abuse
-            return create_error_response(ValidationError("Maximum 20 REGONs allowed per request"))
-        
-        # Validate each REGON
-        valid_regons = []
-        for regon in regons:
-            regon = str(regon).strip()
-            if regon.isdigit() and len(regon) == 9:
-                valid_regons.append(regon)
-            else:
-                logger.warning(f"Skipping invalid REGON: {regon}")
-        
-        if not valid_regons:
-            return create_error_response(ValidationError("No valid 9-digit REGONs provided"))
-        
-        logger.debug(f"Searching multiple REGONs: {valid_regons}")
-        result = api.searchData(regons9=valid_regons)
-        
-        # Transform 'Typ' field values to descriptive Polish text
-        if isinstance(result, list):
-            for item in result:
-                if isinstance(item, dict) and 'Typ' in item:
-                    if item['Typ'] == 'P':
-                        item['Typ'] = "osoba prawna"
-                    elif item['Typ'] == 'F':
-                        item['Typ'] = "osoba fizyczna"
-        
-        return [TextContent(type="text", text=json.dumps(result, indent=2, ensure_ascii=False))]
-        
-    except Exception as e:
-        return create_error_response(e, "Multiple REGON search")
+    _validate_regons_args(arguments)
+    regons = arguments["regons"]
+    
+    if len(regons) > 20:  # Limit to prevent abuse
+        return create_error_response(ValidationError("Maximum 20 REGONs allowed per request"))
+    
+    # Validate each REGON
+    valid_regons = []
+    for regon in regons:
+        regon = str(regon).translate(_IDENTIFIER_STRIP_TABLE)
+        if _REGON9_MATCH(regon) is not None:
+            valid_regons.append(regon)
+        else:
+            logger.warning(f"Skipping invalid REGON: {regon}")
+    
+    if not valid_regons:
+        return create_error_response(ValidationError("No valid 9-digit REGONs provided"))
+    
+    logger.debug(f"Searching multiple REGONs: {valid_regons}")
+    result = await asyncio.to_thread(api.searchData, regons9=valid_regons)
+    
+    # Transform 'Typ' field values to descriptive Polish text
+    if isinstance(result, list):
+        for item in result:
+            if isinstance(item, dict) and 'Typ' in item:
+                if item['Typ'] == 'P':
+                    item['Typ'] = "osoba prawna"
+                elif item['Typ'] == 'F':
+                    item['Typ'] = "osoba fizyczna"
+    
+    return [TextContent(type="text", text=format_json(result))]
 
 @retry_on_network_failure.async_retry
+@tool_error_handler("Multiple KRS search")
 async def handle_search_multiple_krs(arguments: Dict[str, Any], api: RegonAPI) -> List[TextContent]:
     """Handle multiple KRS search with validation and error handling."""
-    try:
-        validate_input(arguments, ["krs_numbers"], {"krs_numbers": list})
-        krs_numbers = arguments["krs_numbers"]
-        
-        if len(krs_numbers) > 20:  # Limit to prevent abuse
-            return create_error_response(ValidationError("Maximum 20 KRS numbers allowed per request"))
-        
-        # Validate each KRS
-        valid_krs = []
-        for krs in krs_numbers:
-            krs = str(krs).strip()
-            if krs.isdigit() and len(krs) == 10:
-                valid_krs.append(krs)
-            else:
-                logger.warning(f"Skipping invalid KRS: {krs}")
-        
-        if not valid_krs:
-            return create_error_response(ValidationError("No valid KRS numbers provided"))
-        
-        logger.debug(f"Searching multiple KRS: {valid_krs}")
-        result = api.searchData(krss=valid_krs)
-        
-        # Transform 'Typ' field values to descriptive Polish text
-        if isinstance(result, list):
-            for item in result:
-                if isinstance(item, dict) and 'Typ' in item:
-                    if item['Typ'] == 'P':
-                        item['Typ'] = "osoba prawna"
-                    elif item['Typ'] == 'F':
-                        item['Typ'] = "osoba fizyczna"
-        
-        return [TextContent(type="text", text=json.dumps(result, indent=2, ensure_ascii=False))]
-        
-    except Exception as e:
-        return create_error_response(e, "Multiple KRS search")
+    _validate_krs_numbers_args(arguments)
+    krs_numbers = arguments["krs_numbers"]
+    
+    if len(krs_numbers) > 20:  # Limit to prevent abuse
+        return create_error_response(ValidationError("Maximum 20 KRS numbers allowed per request"))
+    
+    # Validate each KRS
+    valid_krs = []
+    for krs in krs_numbers:
+        krs = str(krs).translate(_IDENTIFIER_STRIP_TABLE)
+        if _KRS_MATCH(krs) is not None:
+            valid_krs.append(krs)
+        else:
+            logger.warning(f"Skipping invalid KRS: {krs}")
+    
+    if not valid_krs:
+        return create_error_response(ValidationError("No valid KRS numbers provided"))
+    
+    logger.debug(f"Searching multiple KRS: {valid_krs}")
+    result = await asyncio.to_thread(api.searchData, krss=valid_krs)
+    
+    # Transform 'Typ' field values to descriptive Polish text
+    if isinstance(result, list):
+        for item in result:
+            if isinstance(item, dict) and 'Typ' in item:
+                if item['Typ'] == 'P':
+                    item['Typ'] = "osoba prawna"
+                elif item['Typ'] == 'F':
+                    item['Typ'] = "osoba fizyczna"
+    
+    return [TextContent(type="text", text=format_json(result))]
 
 @retry_on_network_failure.async_retry
+@tool_error_handler("Full report request")
 async def handle_get_full_report(arguments: Dict[str, Any], api: RegonAPI) -> List[TextContent]:
     """Handle full report request with validation and error handling."""
-    try:
-        validate_input(arguments, ["regon", "report_name"], {"regon": str, "report_name": str})
-        regon = arguments["regon"].strip()
-        report_name = arguments["report_name"].strip()
-        
-        # Validate REGON format
-        if not regon.isdigit() or len(regon) not in [9, 14]:
-            return create_error_response(ValidationError("REGON must be 9 or 14 digits"))
-        
-        # Validate report name
-        if report_name not in AVAILABLE_REPORTS:
-            return create_error_response(ValidationError(f"Invalid report name. Available: {', '.join(AVAILABLE_REPORTS)}"))
-        
-        logger.debug(f"Getting full report for REGON {regon}, report: {report_name}")
-        result = api.dataDownloadFullReport(regon, report_name)
-        
-        if not result:
-            return [TextContent(type="text", text="ℹ️ No report data available for the specified parameters.")]
-        
-        # Transform 'Typ' field values for BIR11TypPodmiotu report
-        if report_name == "BIR11TypPodmiotu" and isinstance(result, list):
-            for item in result:
-                if isinstance(item, dict) and 'Typ' in item:
-                    if item['Typ'] == 'P':
-                        item['Typ'] = "osoba prawna"
-                    elif item['Typ'] == 'F':
-                        item['Typ'] = "osoba fizyczna"
-        
-        return [TextContent(type="text", text=json.dumps(result, indent=2, ensure_ascii=False))]
-        
-    except Exception as e:
-        return create_error_response(e, "Full report request")
+    _validate_full_report_args(arguments)
+    regon = arguments["regon"].translate(_IDENTIFIER_STRIP_TABLE)
+    report_name = arguments["report_name"].strip()
+    
+    # Validate REGON format
+    if _REGON_MATCH(regon) is None:
+        return create_error_response(ValidationError("REGON must be 9 or 14 digits"))
+    
+    # Validate report name
+    if report_name not in AVAILABLE_REPORTS:
+        return create_error_response(ValidationError(f"Invalid report name. Available: {', '.join(AVAILABLE_REPORTS)}"))
+    
+    logger.debug(f"Getting full report for REGON {regon}, report: {report_name}")
+    result = await asyncio.to_thread(api.dataDownloadFullReport, regon, report_name)
+    
+    if not result:
+        return [TextContent(type="text", text="ℹ️ No report data available for the specified parameters.")]
+    
+    # Transform 'Typ' field values for BIR11TypPodmiotu report
+    if report_name == "BIR11TypPodmiotu" and isinstance(result, list):
+        for item in result:
+            if isinstance(item, dict) and 'Typ' in item:
+                if item['Typ'] == 'P':
+                    item['Typ'] = "osoba prawna"
+                elif item['Typ'] == 'F':
+                    item['Typ'] = "osoba fizyczna"
+    
+    return [TextContent(type="text", text=format_json(result))]
 
 @retry_on_network_failure.async_retry
+@tool_error_handler("Service status request")
 async def handle_get_service_status(arguments: Dict[str, Any], api: RegonAPI) -> List[TextContent]:
     """Handle service status request with error handling."""
-    try:
-        logger.debug("Getting service status")
-        status_code, status_message = api.get_service_status()
-        
-        # Format status with emoji indicators
-        status_emoji = "🟢" if status_code == 1 else "🔴"
-        return [TextContent(type="text", text=f"{status_emoji} Service Status Code: {status_code}\nStatus Message: {status_message}")]
-        
-    except Exception as e:
-        return create_error_response(e, "Service status request")
+    logger.debug("Getting service status")
+    status_code, status_message = await asyncio.to_thread(api.get_service_status)
+    
+    # Format status with emoji indicators
+    status_emoji = _EMOJI_GREEN if status_code == 1 else _EMOJI_RED
+    return [TextContent(type="text", text=f"{status_emoji} Service Status Code: {status_code}\nStatus Message: {status_message}")]
 
 @retry_on_network_failure.async_retry
+@tool_error_handler("Data status request")
 async def handle_get_data_status(arguments: Dict[str, Any], api: RegonAPI) -> List[TextContent]:
     """Handle data status request with error handling."""
-    try:
-        logger.debug("Getting data status")
-        result = api.get_data_status()
-        
-        if not result:
-            return [TextContent(type="text", text="ℹ️ No data status information available.")]
-        
-        return [TextContent(type="text", text=json.dumps(result, indent=2, ensure_ascii=False))]
-        
-    except Exception as e:
-        return create_error_response(e, "Data status request")
+    logger.debug("Getting data status")
+    result = await asyncio.to_thread(api.get_data_status)
+    
+    if not result:
+        return [TextContent(type="text", text="ℹ️ No data status information available.")]
+    
+    return [TextContent(type="text", text=format_json(result))]
 
 @retry_on_network_failure.async_retry
+@tool_error_handler("Last error code request")
 async def handle_get_last_error_code(arguments: Dict[str, Any], api: RegonAPI) -> List[TextContent]:
     """Handle last error code request with error handling."""
-    try:
-        logger.debug("Getting last error code")
-        code, message = api.get_last_code()
-        
-        error_emoji = "🔴" if code != 0 else "🟢"
-        return [TextContent(type="text", text=f"{error_emoji} Last Error Code: {code}\nMessage: {message}")]
-        
-    except Exception as e:
-        return create_error_response(e, "Last error code request")
+    logger.debug("Getting last error code")
+    code, message = await asyncio.to_thread(api.get_last_code)
+    
+    error_emoji = _EMOJI_RED if code != 0 else _EMOJI_GREEN
+    return [TextContent(type="text", text=f"{error_emoji} Last Error Code: {code}\nMessage: {message}")]
 
 @retry_on_network_failure.async_retry
+@tool_error_handler("Last error message request")
 async def handle_get_last_error_message(arguments: Dict[str, Any], api: RegonAPI) -> List[TextContent]:
     """Handle last error message request with error handling."""
-    try:
-        logger.debug("Getting last error message")
-        code, message = api.get_last_code()
-        
-        error_emoji = "🔴" if code != 0 else "🟢"
-        return [TextContent(type="text", text=f"{error_emoji} Last Error Message: {message}")]
-        
-    except Exception as e:
-        return create_error_response(e, "Last error message request")
+    logger.debug("Getting last error message")
+    code, message = await asyncio.to_thread(api.get_last_code)
+    
+    error_emoji = _EMOJI_RED if code != 0 else _EMOJI_GREEN
+    return [TextContent(type="text", text=f"{error_emoji} Last Error Message: {message}")]
 
 @retry_on_network_failure.async_retry
+@tool_error_handler("Session status request")
 async def handle_get_session_status(arguments: Dict[str, Any], api: RegonAPI) -> List[TextContent]:
     """Handle session status request with error handling."""
-    try:
-        logger.debug("Getting session status")
-        status_code, status_message = api.get_service_status()
-        
-        status_emoji = "🟢" if status_code == 1 else "🔴"
-        return [TextContent(type="text", text=f"{status_emoji} Session Status: {status_message} (Code: {status_code})")]
-        
-    except Exception as e:
-        return create_error_response(e, "Session status request")
+    logger.debug("Getting session status")
+    status_code, status_message = await asyncio.to_thread(api.get_service_status)
+    
+    status_emoji = _EMOJI_GREEN if status_code == 1 else _EMOJI_RED
+    return [TextContent(type="text", text=f"{status_emoji} Session Status: {status_message} (Code: {status_code})")]
 
 @retry_on_network_failure.async_retry
+@tool_error_handler("Available operations request")
 async def handle_get_available_operations(arguments: Dict[str, Any], api: RegonAPI) -> List[TextContent]:
     """Handle available operations request with error handling."""
-    try:
-        logger.debug("Getting available operations")
-        operations = api.get_operations()
-        
-        if not operations:
-            return [TextContent(type="text", text="ℹ️ No operations information available.")]
-        
-        return [TextContent(type="text", text=json.dumps(operations, indent=2, ensure_ascii=False))]
-        
-    except Exception as e:
-        return create_error_response(e, "Available operations request")
+    logger.debug("Getting available operations")
+    operations = await asyncio.to_thread(api.get_operations)
+    
+    if not operations:
+        return [TextContent(type="text", text="ℹ️ No operations information available.")]
+    
+    return [TextContent(type="text", text=format_json(operations))]
+
+# Tool name -> handler dispatch table used by route_tool_call
+TOOL_HANDLERS: Dict[str, Callable[[Dict[str, Any], RegonAPI], Awaitable[List[TextContent]]]] = {
+    "regon_search_by_nip": handle_search_by_nip,
+    "regon_search_by_regon": handle_search_by_regon,
+    "regon_search_by_krs": handle_search_by_krs,
+    "regon_search_multiple_nips": handle_search_multiple_nips,
+    "regon_search_multiple_regons9": handle_search_multiple_regons9,
+    "regon_search_multiple_krs": handle_search_multiple_krs,
+    "regon_get_full_report": handle_get_full_report,
+    "regon_get_service_status": handle_get_service_status,
+    "regon_get_data_status": handle_get_data_status,
+    "regon_get_last_error_code": handle_get_last_error_code,
+    "regon_get_last_error_message": handle_get_last_error_message,
+    "regon_get_session_status": handle_get_session_status,
+    "regon_get_available_operations": handle_get_available_operations,
+}
 
 @safe_execute
 def setup_signal_handlers():
@@ -977,6 +1003,10 @@ async def main():
     # Set up signal handlers for graceful shutdown
     setup_signal_handlers()
     
+    # RegonAPI SOAP calls run in worker threads; they are I/O-bound, so allow
+    # more of them to overlap than the default executor would
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=16))
+    
     # Initialize basic logging first (before argument parsing)
     logger = setup_logging('INFO')  # Default level until we parse args
     
@@ -995,8 +1025,10 @@ async def main():
         config['log_level'] = getattr(args, 'log_level', 'INFO')
         config['tools_config'] = getattr(args, 'tools_config', None)
         
-        # Re-setup logging with the correct level from arguments
-        logger = setup_logging(config['log_level'])
+        # Re-setup logging only if the requested level differs from the
+        # INFO default configured above
+        if str(config['log_level']).upper() != 'INFO':
+            logger = setup_logging(config['log_level'])
         if logger is None:
             print("ERROR: Failed to setup logging, exiting")
             return 1
@@ -1056,7 +1088,7 @@ async def main():
                 
             except Exception as e:
                 restart_count += 1
-                logger.error(f"Server error (attempt {restart_count}/{max_restarts}): {e}", exc_info=True)
+                logger.error(f"Server error (attempt {restart_count}/{max_restarts}): {e}", exc_info=traceback_due())
                 
                 if restart_count < max_restarts:
                     wait_time = min(5 * restart_count, 30)  # Exponential backoff, max 30s
@@ -23,7 +23,8 @@ Configuration:
     - Logging level can be controlled via command line or LOG_LEVEL env var
     
 Dependencies:
-    pip install fastapi uvicorn
+    pip install fastapi "uvicorn[standard]"  # standard extra brings uvloop + httptools
+    pip install brotli-asgi # optional, Brotli response compression
 """
 
 import argparse
@@ -31,9 +32,16 @@ import asyncio
 import json
 import logging
 import os
+import random
+import re
 import signal
 import sys
 import traceback
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Union
 import time
 
@@ -41,12 +49,59 @@ try:
     from fastapi import FastAPI, HTTPException, Request, Response
     from fastapi.responses import JSONResponse
     from fastapi.middleware.cors import CORSMiddleware
+    from fastapi.middleware.gzip import GZipMiddleware
     from fastapi.exceptions import RequestValidationError
     import uvicorn
     FASTAPI_AVAILABLE = True
 except ImportError:
     FASTAPI_AVAILABLE = False
 
+# uvloop is optional (not available on Windows); asyncio is used without it
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+# httptools is optional; uvicorn falls back to the pure-Python h11 parser
+try:
+    import httptools
+    HTTPTOOLS_AVAILABLE = True
+except ImportError:
+    HTTPTOOLS_AVAILABLE = False
+
+# brotli-asgi is optional; responses are gzip-compressed without it
+try:
+    from brotli_asgi import BrotliMiddleware
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+# orjson is optional; responses fall back to Starlette's stdlib JSON rendering
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch the latter
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+def json_dumps_bytes(content: Any) -> bytes:
+    """Serialize content to compact UTF-8 JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(content)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+if FASTAPI_AVAILABLE:
+    class FastJSONResponse(JSONResponse):
+        """JSONResponse rendered with orjson when it is installed."""
+        
+        def render(self, content: Any) -> bytes:
+            if ORJSON_AVAILABLE:
+                return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+            return super().render(content)
+
 # Import error handling framework
 ERROR_HANDLING_AVAILABLE = False
 try:
@@ -56,7 +111,7 @@ try:
         ServerError, ValidationError, APIError, NetworkError,
         safe_execute, safe_async_execute,
         RetryMechanism, HealthChecker,
-        sanitize_string, validate_input
+        sanitize_string, validate_input, traceback_due
     )
     ERROR_HANDLING_AVAILABLE = True
 except ImportError as e:
@@ -66,7 +121,7 @@ except ImportError as e:
             ServerError, ValidationError, APIError, NetworkError,
             safe_execute, safe_async_execute,
             RetryMechanism, HealthChecker,
-            sanitize_string, validate_input
+            sanitize_string, validate_input, traceback_due
         )
         ERROR_HANDLING_AVAILABLE = True
     except ImportError as e2:
@@ -86,10 +141,10 @@ except ImportError as e:
         class NetworkError(Exception):
             pass
         class RetryMechanism:
-            def __init__(self, *args, **kwargs):
-                pass
-            async def execute_async(self, func):
-                return await func()
+            def __init__(self, max_retries=3, delay=1.0, backoff_factor=2.0):
+                self.max_retries = max_retries
+                self.delay = delay
+                self.backoff_factor = backoff_factor
         class HealthChecker:
             def run_checks(self):
                 return []
@@ -97,28 +152,90 @@ except ImportError as e:
             return str(text).strip()
         def validate_input(data, required_fields, field_types=None):
             return data
+        def traceback_due(interval=5.0):
+            return True
+
+# Size of the per-process memo caches for identifier validation/sanitization
+VALIDATION_CACHE_SIZE = 4096
+
+# Identifier formats; separators people type into the numbers (e.g. "734-286-71-48")
+# are dropped first, matching the normalization done by the tool handlers
+_IDENTIFIER_STRIP_TABLE = str.maketrans('', '', ' -\t\r\n')
+_NIP_RE = re.compile(r"[0-9]{10}")
+_KRS_RE = re.compile(r"[0-9]{10}")
+_REGON_RE = re.compile(r"[0-9]{9}(?:[0-9]{5})?")
 
 # Create a compatibility wrapper for InputValidator
+# The checks are pure functions of their (string) input, so results are memoized
 class InputValidator:
     """Compatibility wrapper for validation functions."""
     @staticmethod
+    @lru_cache(maxsize=VALIDATION_CACHE_SIZE)
     def sanitize_string(text, max_length=1000):
         return sanitize_string(text, max_length) if ERROR_HANDLING_AVAILABLE else str(text).strip()
     
     @staticmethod
+    @lru_cache(maxsize=VALIDATION_CACHE_SIZE)
     def validate_nip(nip):
         """Basic NIP validation - should be 10 digits."""
-        return len(str(nip).strip()) >= 10
+        return _NIP_RE.fullmatch(str(nip).translate(_IDENTIFIER_STRIP_TABLE)) is not None
     
     @staticmethod
+    @lru_cache(maxsize=VALIDATION_CACHE_SIZE)
     def validate_krs(krs):
         """Basic KRS validation - should be 10 digits.""" 
-        return len(str(krs).strip()) >= 10
+        return _KRS_RE.fullmatch(str(krs).translate(_IDENTIFIER_STRIP_TABLE)) is not None
     
     @staticmethod
+    @lru_cache(maxsize=VALIDATION_CACHE_SIZE)
     def validate_regon(regon):
         """Basic REGON validation - should be 9 or 14 digits."""
-        return len(str(regon).strip()) >= 9
+        return _REGON_RE.fullmatch(str(regon).translate(_IDENTIFIER_STRIP_TABLE)) is not None
+
+class TTLCache:
+    """Small in-memory LRU cache whose entries expire after a fixed TTL."""
+    
+    def __init__(self, maxsize: int = 10_000, ttl: float = 3600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Any, tuple]" = OrderedDict()
+    
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+    
+    def set(self, key: Any, value: Any) -> None:
+        """Store value under key, evicting the least recently used entry when full."""
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def clear(self) -> None:
+        self._data.clear()
+    
+    def __len__(self) -> int:
+        return len(self._data)
+
+# /search/<kind>/{value} dispatch tables
+SEARCH_TOOLS = {
+    "nip": "regon_search_by_nip",
+    "krs": "regon_search_by_krs",
+    "regon": "regon_search_by_regon",
+}
+SEARCH_VALIDATORS = {
+    "nip": InputValidator.validate_nip,
+    "krs": InputValidator.validate_krs,
+    "regon": InputValidator.validate_regon,
+}
 
 # Import the original server implementation to avoid code duplication
 try:
@@ -141,14 +258,37 @@ config = {
     'log_level': 'INFO',
     'host': 'localhost',
     'port': 8000,
-    'tools_config': None
+    'tools_config': None,
+    'cors_origins': ['*'],
+    'workers': 1
 }
 
+# Worker processes rebuild their configuration from this environment variable
+WORKER_CONFIG_ENV = 'REGON_HTTP_WORKER_CONFIG'
+
+# GUS lookups by identifier are deterministic, so successful results are cached
+SEARCH_CACHE_TTL = 3600
+SEARCH_CACHE_CONTROL = f"public, max-age={SEARCH_CACHE_TTL}"
+search_cache = TTLCache(maxsize=10_000, ttl=SEARCH_CACHE_TTL)
+
+# Health results are reused for a few seconds to absorb monitoring probes
+HEALTH_CACHE_TTL = 3
+HEALTH_CACHE_CONTROL = f"max-age={HEALTH_CACHE_TTL}"
+
+# Blocking SOAP calls run in the default executor; size it for concurrent requests
+EXECUTOR_MAX_WORKERS = 32
+
+# Response timestamps are informational, so a cached wall-clock value refreshed
+# in the background is used instead of calling time.time() per response
+CLOCK_REFRESH_INTERVAL = 0.25
+_last_now = time.time()
+
 # Global instances
 logger: Optional[logging.Logger] = None
 retry_mechanism: Optional[RetryMechanism] = None
 health_checker: Optional[HealthChecker] = None
 input_validator: Optional[InputValidator] = None
+http_server: Optional["uvicorn.Server"] = None
 
 # Configure UTF-8 encoding for proper Polish character handling
 os.environ['PYTHONIOENCODING'] = 'utf-8'
@@ -175,6 +315,8 @@ Examples:
   python server_http.py --host 0.0.0.0 --port 8080       # Run on all interfaces, port 8080
   python server_http.py --production                      # Run in production mode
   python server_http.py --production --log-level DEBUG    # Production with debug logging
+  python server_http.py --production --workers 8          # Production with 8 worker processes
+  python server_http.py --cors-origin https://app.example.com  # Allow a single web origin
             """
         )
         
@@ -211,8 +353,31 @@ Examples:
             help='Tool configuration to use (default, polish, minimal, detailed). Uses TOOLS_CONFIG env var if not specified.'
         )
         
+        parser.add_argument(
+            '--cors-origin',
+            action='append',
+            dest='cors_origins',
+            metavar='ORIGIN',
+            help='Allowed CORS origin; repeat for several origins, pass "" to disable CORS '
+                 '(default: comma-separated CORS_ORIGINS env var, or "*")'
+        )
+        
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=None,
+            help='Number of uvicorn worker processes (default: min(4, CPU count) in production, 1 in test mode)'
+        )
+        
         args = parser.parse_args()
         
+        if args.workers is None:
+            args.workers = min(4, os.cpu_count() or 1) if args.production else 1
+        
+        if args.cors_origins is None:
+            args.cors_origins = os.getenv('CORS_ORIGINS', '*').split(',')
+        args.cors_origins = [origin.strip() for origin in args.cors_origins if origin.strip()]
+        
         # Validate arguments
         if args.port < 1 or args.port > 65535:
             raise ValueError(f"Port must be between 1 and 65535, got: {args.port}")
@@ -220,6 +385,9 @@ Examples:
         if args.host and not args.host.strip():
             raise ValueError("Host cannot be empty")
         
+        if args.workers < 1:
+            raise ValueError(f"Workers must be at least 1, got: {args.workers}")
+        
         return args
         
     except Exception as e:
@@ -292,7 +460,11 @@ def setup_signal_handlers():
     def signal_handler(signum, frame):
         if logger:
             logger.info(f"Received signal {signum}, initiating graceful shutdown...")
-        sys.exit(0)
+        if http_server is not None:
+            # Let uvicorn finish in-flight requests; serve() then returns normally
+            http_server.should_exit = True
+        else:
+            sys.exit(0)
     
     try:
         signal.signal(signal.SIGINT, signal_handler)
@@ -314,32 +486,32 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
             "type": error["type"]
         })
     
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=422,
         content={
             "error": "Validation Error",
             "details": error_details,
-            "timestamp": time.time()
+            "timestamp": cached_time()
         }
     )
 
 async def http_exception_handler(request: Request, exc: HTTPException):
     """Handle HTTP exceptions with consistent format."""
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=exc.status_code,
         content={
             "error": exc.detail,
             "status_code": exc.status_code,
-            "timestamp": time.time()
+            "timestamp": cached_time()
         }
     )
 
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle general exceptions with safe error reporting."""
-    error_id = f"err_{int(time.time())}"
+    error_id = f"err_{int(cached_time())}"
     
     if logger:
-        logger.error(f"Unhandled exception [{error_id}]: {str(exc)}", exc_info=True)
+        logger.error("Unhandled exception [%s]: %s", error_id, exc, exc_info=traceback_due())
     
     # In production, don't expose internal error details
     if config.get('production_mode', False):
@@ -347,15 +519,36 @@ async def general_exception_handler(request: Request, exc: Exception):
     else:
         detail = f"Internal server error: {str(exc)} (ID: {error_id})"
     
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=500,
         content={
             "error": detail,
             "error_id": error_id,
-            "timestamp": time.time()
+            "timestamp": cached_time()
         }
     )
 
+def cached_time() -> float:
+    """Return the wall-clock time cached by the background clock task."""
+    return _last_now
+
+async def _refresh_clock():
+    """Refresh the cached wall-clock time until cancelled."""
+    global _last_now
+    while True:
+        _last_now = time.time()
+        await asyncio.sleep(CLOCK_REFRESH_INTERVAL)
+
+@asynccontextmanager
+async def app_lifespan(app: "FastAPI"):
+    """Set up the executor and run background tasks for the lifetime of the application."""
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=EXECUTOR_MAX_WORKERS))
+    clock_task = asyncio.create_task(_refresh_clock())
+    try:
+        yield
+    finally:
+        clock_task.cancel()
+
 @safe_execute
 def create_http_app(production_mode: bool = False) -> Optional[FastAPI]:
     """Create FastAPI application with MCP endpoints and comprehensive error handling."""
@@ -372,7 +565,9 @@ def create_http_app(production_mode: bool = False) -> Optional[FastAPI]:
             description="HTTP wrapper for RegonAPI MCP Server - Polish GUS REGON Database Client",
             version="1.0.0",
             docs_url="/docs",
-            redoc_url="/redoc"
+            redoc_url="/redoc",
+            default_response_class=FastJSONResponse,
+            lifespan=app_lifespan
         )
         
         # Add exception handlers
@@ -380,62 +575,123 @@ def create_http_app(production_mode: bool = False) -> Optional[FastAPI]:
         app.add_exception_handler(HTTPException, http_exception_handler)
         app.add_exception_handler(Exception, general_exception_handler)
         
-        # Enable CORS for web client access
-        app.add_middleware(
-            CORSMiddleware,
-            allow_origins=["*"],
-            allow_credentials=True,
-            allow_methods=["*"],
-            allow_headers=["*"],
-        )
+        # Enable CORS for web client access; the API uses no cookies, so credentials
+        # are not allowed, and an empty origin list leaves the middleware out entirely
+        cors_origins = config.get('cors_origins', ['*'])
+        if cors_origins:
+            app.add_middleware(
+                CORSMiddleware,
+                allow_origins=cors_origins,
+                allow_credentials=False,
+                allow_methods=["*"],
+                allow_headers=["*"],
+            )
+        
+        # Compress larger JSON payloads (tool listings, full company records)
+        if BROTLI_AVAILABLE:
+            app.add_middleware(BrotliMiddleware, minimum_size=1024, gzip_fallback=True)
+        else:
+            app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
         
         # Set up the configuration in the original module
         stdio_server_module.config['production_mode'] = production_mode
         
-        @app.get("/")
+        # The stdio server keeps one authenticated RegonAPI client per process;
+        # this returns it, creating it only on first use or after a reset
+        async def initialize_api():
+            return await asyncio.to_thread(stdio_server_module.initialize_regon_api, production_mode)
+        
+        # The tool registry is static per process, so build the listing once
+        tools_cache: Dict[str, List[Dict[str, Any]]] = {}
+        tools_cache_lock = asyncio.Lock()
+        
+        async def get_tools_cached() -> List[Dict[str, Any]]:
+            """Return the tool listing, building it on first use."""
+            if "tools" in tools_cache:
+                return tools_cache["tools"]
+            
+            async with tools_cache_lock:
+                if "tools" not in tools_cache:
+                    tools = await stdio_server_module.handle_list_tools()
+                    
+                    tools_data = []
+                    for tool in tools or []:
+                        tool_info = {
+                            "name": tool.name,
+                            "description": tool.description
+                        }
+                        
+                        # Safely add schema if available
+                        if hasattr(tool, 'inputSchema') and tool.inputSchema:
+                            tool_info["inputSchema"] = tool.inputSchema
+                        
+                        tools_data.append(tool_info)
+                    
+                    tools_cache["tools"] = tools_data
+            
+            return tools_cache["tools"]
+        
+        # The root payload is static apart from the timestamp and health status,
+        # so serialize it once and splice the dynamic fields in per request
+        mode = "production" if production_mode else "test"
+        server_info = {
+            "service": "RegonAPI MCP Server",
+            "version": "1.0.0",
+            "mode": mode,
+            "description": "HTTP wrapper for Polish GUS REGON Database access",
+            "endpoints": {
+                "tools": "/tools",
+                "tools/call": "/tools/call",
+                "health": "/health",
+                "search": {
+                    "nip": "/search/nip/{nip}",
+                    "krs": "/search/krs/{krs}",
+                    "regon": "/search/regon/{regon}"
+                }
+            },
+            "encoding": "UTF-8 ✅",
+            "polish_characters": "SPÓŁKA, Północ ✅"
+        }
+        root_prefix = json_dumps_bytes(server_info)[:-1]
+        
+        @app.get("/", response_model=None)
         @safe_async_execute
         async def root():
             """Root endpoint with server information and health status."""
-            mode = "production" if production_mode else "test"
-            
-            # Basic server info
-            server_info = {
-                "service": "RegonAPI MCP Server",
-                "version": "1.0.0",
-                "mode": mode,
-                "description": "HTTP wrapper for Polish GUS REGON Database access",
-                "endpoints": {
-                    "tools": "/tools",
-                    "tools/call": "/tools/call",
-                    "health": "/health",
-                    "search": {
-                        "nip": "/search/nip/{nip}",
-                        "krs": "/search/krs/{krs}",
-                        "regon": "/search/regon/{regon}"
-                    }
-                },
-                "encoding": "UTF-8 ✅",
-                "polish_characters": "SPÓŁKA, Północ ✅",
-                "timestamp": time.time()
-            }
+            body = root_prefix + b',"timestamp":' + repr(cached_time()).encode()
             
             # Add health status if available
             if health_checker:
                 try:
                     health_results = health_checker.run_checks()
-                    server_info["health_status"] = "healthy" if health_results else "degraded"
+                    health_status = "healthy" if health_results else "degraded"
                 except Exception:
-                    server_info["health_status"] = "unknown"
+                    health_status = "unknown"
+                body += b',"health_status":"' + health_status.encode() + b'"'
             
-            return server_info
+            return Response(content=body + b"}", media_type="application/json")
+        
+        # Monitors probe /health every few seconds; serve a recent result from cache
+        health_cache = TTLCache(maxsize=1, ttl=HEALTH_CACHE_TTL)
         
-        @app.get("/health")
+        def health_response(request: Request, body: bytes, etag: str) -> Response:
+            """Build the /health response, answering conditional requests with 304."""
+            headers = {"Cache-Control": HEALTH_CACHE_CONTROL, "ETag": etag}
+            if request.headers.get("if-none-match") == etag:
+                return Response(status_code=304, headers=headers)
+            return Response(content=body, media_type="application/json", headers=headers)
+        
+        @app.get("/health", response_model=None)
         @safe_async_execute
-        async def health_check():
+        async def health_check(request: Request):
             """Comprehensive health check endpoint."""
+            cached = health_cache.get("health")
+            if cached is not None:
+                return health_response(request, *cached)
+            
             health_data = {
                 "status": "unknown",
-                "timestamp": time.time(),
+                "timestamp": cached_time(),
                 "checks": {}
             }
             
@@ -443,15 +699,15 @@ def create_http_app(production_mode: bool = False) -> Optional[FastAPI]:
                 # Test RegonAPI initialization
                 health_data["checks"]["regon_api"] = {"status": "checking"}
                 
-                if retry_mechanism:
-                    api = await retry_mechanism.execute_async(
-                        lambda: stdio_server_module.initialize_regon_api(production_mode)
-                    )
-                else:
-                    api = stdio_server_module.initialize_regon_api(production_mode)
+                api = await initialize_api()
                 
                 if api:
-                    status_code, status_message = api.get_service_status()
+                    try:
+                        status_code, status_message = await asyncio.to_thread(api.get_service_status)
+                    except Exception:
+                        # Re-authenticate on the next request instead of reusing a broken client
+                        stdio_server_module.reset_regon_api()
+                        raise
                     health_data["checks"]["regon_api"] = {
                         "status": "healthy",
                         "status_code": status_code,
@@ -466,7 +722,7 @@ def create_http_app(production_mode: bool = False) -> Optional[FastAPI]:
                 # Test tool availability
                 health_data["checks"]["tools"] = {"status": "checking"}
                 try:
-                    tools = await stdio_server_module.handle_list_tools()
+                    tools = await get_tools_cached()
                     health_data["checks"]["tools"] = {
                         "status": "healthy",
                         "count": len(tools) if tools else 0
@@ -491,11 +747,14 @@ def create_http_app(production_mode: bool = False) -> Optional[FastAPI]:
                     "platform": sys.platform
                 }
                 
-                return health_data
+                body = json_dumps_bytes(health_data)
+                etag = f'"{zlib.crc32(body):08x}"'
+                health_cache.set("health", (body, etag))
+                return health_response(request, body, etag)
                 
             except Exception as e:
                 if logger:
-                    logger.error(f"Health check failed: {e}", exc_info=True)
+                    logger.error("Health check failed: %s", e, exc_info=traceback_due())
                 
                 health_data["status"] = "unhealthy"
                 health_data["error"] = str(e)
@@ -505,53 +764,32 @@ def create_http_app(production_mode: bool = False) -> Optional[FastAPI]:
                     detail=f"Service unhealthy: {e}"
                 )
         
-        @app.get("/tools")
+        @app.get("/tools", response_model=None)
         @safe_async_execute
         async def list_tools():
             """List available MCP tools with error handling."""
             try:
-                if retry_mechanism:
-                    tools = await retry_mechanism.execute_async(
-                        stdio_server_module.handle_list_tools
-                    )
-                else:
-                    tools = await stdio_server_module.handle_list_tools()
-                
-                if not tools:
-                    return {"tools": [], "count": 0, "timestamp": time.time()}
-                
-                tools_data = []
-                for tool in tools:
-                    tool_info = {
-                        "name": tool.name,
-                        "description": tool.description
-                    }
-                    
-                    # Safely add schema if available
-                    if hasattr(tool, 'inputSchema') and tool.inputSchema:
-                        tool_info["inputSchema"] = tool.inputSchema
-                    
-                    tools_data.append(tool_info)
+                tools_data = await get_tools_cached()
                 
-                return {
+                return FastJSONResponse(content={
                     "tools": tools_data,
                     "count": len(tools_data),
-                    "timestamp": time.time()
-                }
+                    "timestamp": cached_time()
+                })
                 
             except Exception as e:
                 if logger:
-                    logger.error(f"Error listing tools: {e}", exc_info=True)
+                    logger.error("Error listing tools: %s", e, exc_info=traceback_due())
                 raise HTTPException(
                     status_code=500, 
                     detail=f"Failed to list tools: {e}"
                 )
         
-        @app.post("/tools/call")
+        @app.post("/tools/call", response_model=None)
         @safe_async_execute
         async def call_tool(request: dict):
             """Call a specific MCP tool with comprehensive validation and error handling."""
-            request_id = f"req_{int(time.time())}"
+            request_id = f"req_{int(cached_time())}"
             
             try:
                 # Validate request structure
@@ -584,34 +822,23 @@ def create_http_app(production_mode: bool = False) -> Optional[FastAPI]:
                 
                 # Log the request
                 if logger:
-                    logger.info(f"Tool call [{request_id}]: {tool_name} with args: {arguments}")
+                    logger.info("Tool call [%s]: %s with args: %s", request_id, tool_name, arguments)
                 
-                # Execute tool with retry mechanism
-                start_time = time.time()
+                # Execute tool
+                start_time = time.perf_counter()
                 
-                if retry_mechanism:
-                    result = await retry_mechanism.execute_async(
-                        lambda: stdio_server_module.handle_call_tool(tool_name, arguments)
-                    )
-                else:
-                    result = await stdio_server_module.handle_call_tool(tool_name, arguments)
+                result = await stdio_server_module.handle_call_tool(tool_name, arguments)
                 
-                execution_time = time.time() - start_time
+                execution_time = time.perf_counter() - start_time
                 
                 # Convert result to response format
                 response_data = []
-                if result:
-                    for content in result:
-                        if hasattr(content, 'text'):
-                            response_data.append({
-                                "type": "text",
-                                "text": content.text
-                            })
-                        else:
-                            response_data.append({
-                                "type": "text",
-                                "text": str(content)
-                            })
+                for content in result or ():
+                    text = getattr(content, 'text', None)
+                    response_data.append({
+                        "type": "text",
+                        "text": text if text is not None else str(content)
+                    })
                 
                 response = {
                     "result": response_data,
@@ -619,19 +846,19 @@ def create_http_app(production_mode: bool = False) -> Optional[FastAPI]:
                     "arguments": arguments,
                     "request_id": request_id,
                     "execution_time": round(execution_time, 3),
-                    "timestamp": time.time()
+                    "timestamp": cached_time()
                 }
                 
                 if logger:
-                    logger.info(f"Tool call [{request_id}] completed in {execution_time:.3f}s")
+                    logger.info("Tool call [%s] completed in %.3fs", request_id, execution_time)
                 
-                return response
+                return FastJSONResponse(content=response)
                 
             except HTTPException:
                 raise
             except Exception as e:
                 if logger:
-                    logger.error(f"Error calling tool [{request_id}] {tool_name}: {e}", exc_info=True)
+                    logger.error("Error calling tool [%s] %s: %s", request_id, tool_name, e, exc_info=traceback_due())
                 
                 error_detail = f"Tool execution failed: {e}" if not config.get('production_mode') else "Tool execution failed"
                 
@@ -640,111 +867,67 @@ def create_http_app(production_mode: bool = False) -> Optional[FastAPI]:
                     detail=error_detail
                 )
         
-        # Convenience endpoints for common operations with validation
-        @app.get("/search/nip/{nip}")
+        # Convenience endpoints for common operations with validation; one
+        # route per kind, so unknown kinds are a plain 404 from the router
         @safe_async_execute
-        async def search_by_nip(nip: str):
-            """Search company by NIP with validation (convenience endpoint)."""
+        async def search_by_identifier(kind: str, value: str):
+            """Search company by NIP, KRS or REGON with validation (convenience endpoint)."""
+            tool_name = SEARCH_TOOLS[kind]
+            label = kind.upper()
+            
             try:
-                # Validate and sanitize NIP
+                # Validate and sanitize the identifier
                 if input_validator:
-                    if not input_validator.validate_nip(nip):
+                    if not SEARCH_VALIDATORS[kind](value):
                         raise HTTPException(
                             status_code=400, 
-                            detail="Invalid NIP format"
+                            detail=f"Invalid {label} format"
                         )
-                    nip = input_validator.sanitize_string(nip)
+                    value = input_validator.sanitize_string(value)
                 
-                result = await stdio_server_module.handle_call_tool("regon_search_by_nip", {"nip": nip})
+                response_data = {kind: value, "timestamp": cached_time()}
                 
-                response_data = {"nip": nip, "timestamp": time.time()}
+                cache_key = (tool_name, value)
+                cached = search_cache.get(cache_key)
+                if cached is not None:
+                    response_data["result"] = cached
+                    return FastJSONResponse(content=response_data, headers={"Cache-Control": SEARCH_CACHE_CONTROL})
                 
-                if result and len(result) > 0 and hasattr(result[0], 'text'):
-                    try:
-                        response_data["result"] = json.loads(result[0].text)
-                    except json.JSONDecodeError:
-                        response_data["result"] = result[0].text
-                else:
-                    response_data["result"] = None
-                
-                return response_data
-                
-            except HTTPException:
-                raise
-            except Exception as e:
-                if logger:
-                    logger.error(f"NIP search failed for {nip}: {e}", exc_info=True)
-                raise HTTPException(status_code=500, detail=f"NIP search failed: {e}")
-        
-        @app.get("/search/krs/{krs}")
-        @safe_async_execute
-        async def search_by_krs(krs: str):
-            """Search company by KRS with validation (convenience endpoint)."""
-            try:
-                # Validate and sanitize KRS
-                if input_validator:
-                    if not input_validator.validate_krs(krs):
-                        raise HTTPException(
-                            status_code=400, 
-                            detail="Invalid KRS format"
-                        )
-                    krs = input_validator.sanitize_string(krs)
+                result = await stdio_server_module.handle_call_tool(tool_name, {kind: value})
                 
-                result = await stdio_server_module.handle_call_tool("regon_search_by_krs", {"krs": krs})
-                
-                response_data = {"krs": krs, "timestamp": time.time()}
-                
-                if result and len(result) > 0 and hasattr(result[0], 'text'):
+                first = result[0] if result else None
+                text = getattr(first, 'text', None)
+                if text is not None:
                     try:
-                        response_data["result"] = json.loads(result[0].text)
+                        response_data["result"] = _json_loads(text)
                     except json.JSONDecodeError:
-                        response_data["result"] = result[0].text
+                        # Plain-text results are error messages; do not cache them
+                        response_data["result"] = text
+                        return FastJSONResponse(content=response_data)
                 else:
                     response_data["result"] = None
+                    return FastJSONResponse(content=response_data)
                 
-                return response_data
+                search_cache.set(cache_key, response_data["result"])
+                return FastJSONResponse(content=response_data, headers={"Cache-Control": SEARCH_CACHE_CONTROL})
                 
             except HTTPException:
                 raise
             except Exception as e:
                 if logger:
-                    logger.error(f"KRS search failed for {krs}: {e}", exc_info=True)
-                raise HTTPException(status_code=500, detail=f"KRS search failed: {e}")
+                    logger.error("%s search failed for %s: %s", label, value, e, exc_info=traceback_due())
+                raise HTTPException(status_code=500, detail=f"{label} search failed: {e}")
         
-        @app.get("/search/regon/{regon}")
-        @safe_async_execute
-        async def search_by_regon(regon: str):
-            """Search company by REGON with validation (convenience endpoint)."""
-            try:
-                # Validate and sanitize REGON
-                if input_validator:
-                    if not input_validator.validate_regon(regon):
-                        raise HTTPException(
-                            status_code=400, 
-                            detail="Invalid REGON format"
-                        )
-                    regon = input_validator.sanitize_string(regon)
-                
-                result = await stdio_server_module.handle_call_tool("regon_search_by_regon", {"regon": regon})
-                
-                response_data = {"regon": regon, "timestamp": time.time()}
-                
-                if result and len(result) > 0 and hasattr(result[0], 'text'):
-                    try:
-                        response_data["result"] = json.loads(result[0].text)
-                    except json.JSONDecodeError:
-                        response_data["result"] = result[0].text
-                else:
-                    response_data["result"] = None
-                
-                return response_data
-                
-            except HTTPException:
-                raise
-            except Exception as e:
-                if logger:
-                    logger.error(f"REGON search failed for {regon}: {e}", exc_info=True)
-                raise HTTPException(status_code=500, detail=f"REGON search failed: {e}")
+        def search_endpoint(kind: str):
+            """Build the GET /search/<kind>/{value} endpoint for one identifier kind."""
+            async def endpoint(value: str):
+                return await search_by_identifier(kind, value)
+            endpoint.__name__ = f"search_by_{kind}"
+            return endpoint
+        
+        for kind in SEARCH_TOOLS:
+            app.add_api_route(f"/search/{kind}/{{value}}", search_endpoint(kind),
+                              methods=["GET"], response_model=None)
         
         return app
         
@@ -753,17 +936,145 @@ def create_http_app(production_mode: bool = False) -> Optional[FastAPI]:
             logger.error(f"Failed to create FastAPI app: {e}", exc_info=True)
         raise ServerError(f"Application creation failed: {e}")
 
-@safe_async_execute
-async def run_http_server() -> int:
-    """Run the HTTP MCP server with comprehensive error handling and recovery."""
-    global logger, config
+def access_log_enabled() -> bool:
+    """
+    Decide whether uvicorn writes a log line per request.
+    
+    Access logging is on in test mode and off in production; the
+    REGON_ACCESS_LOG environment variable (1/true/yes/on) overrides both.
+    """
+    env_value = os.getenv('REGON_ACCESS_LOG')
+    if env_value is not None:
+        return env_value.strip().lower() in ('1', 'true', 'yes', 'on')
+    return not config['production_mode']
+
+def _env_int(name: str, default: int) -> int:
+    """Read a positive integer from the environment, falling back on bad values."""
+    try:
+        value = int(os.getenv(name, default))
+    except ValueError:
+        return default
+    return value if value > 0 else default
+
+def connection_settings() -> Dict[str, int]:
+    """
+    Connection handling options shared by the single and multi-worker servers.
+    
+    MCP clients issue many small calls per session, so idle connections are
+    kept open longer than uvicorn's 5s default, and concurrency is capped so
+    an overloaded server answers 503 instead of queueing without bound.
+    
+    Returns:
+        Keyword arguments for uvicorn.Config / uvicorn.run
+    """
+    return {
+        'timeout_keep_alive': _env_int('REGON_KEEPALIVE', 30),
+        'limit_concurrency': _env_int('REGON_MAX_CONC', 1000),
+        'backlog': 2048,
+        'h11_max_incomplete_event_size': 16 * 1024,  # Caps slow, oversized headers (h11 only)
+    }
+
+def app_factory() -> FastAPI:
+    """
+    Create the FastAPI application inside a uvicorn worker process.
+    
+    Used when the server runs with more than one worker; each worker gets its
+    own retry mechanism, health checker and RegonAPI client.
+    
+    Returns:
+        Configured FastAPI application
+    """
+    global logger
+    
+    config.update(json.loads(os.environ[WORKER_CONFIG_ENV]))
+    logger = setup_http_logging(config['log_level'])
+    initialize_global_components()
+    
+    stdio_server_module.config.update({
+        'production_mode': config['production_mode'],
+        'log_level': config['log_level'],
+        'tools_config': config['tools_config']
+    })
+    stdio_server_module.logger = stdio_server_module.setup_logging(config['log_level'])
+    
+    return create_http_app(config['production_mode'])
+
+def run_http_workers(args: argparse.Namespace) -> int:
+    """
+    Run the HTTP server as several uvicorn worker processes.
+    
+    uvicorn only supports multiple workers when it imports the application
+    itself, so the parsed configuration is handed to app_factory() through
+    the environment.
+    
+    Args:
+        args: Parsed command line arguments
+        
+    Returns:
+        Process exit code
+    """
+    global logger
+    
+    config.update({
+        'production_mode': bool(args.production),
+        'log_level': args.log_level,
+        'host': args.host,
+        'port': args.port,
+        'tools_config': args.tools_config,
+        'cors_origins': args.cors_origins,
+        'workers': args.workers
+    })
+    os.environ[WORKER_CONFIG_ENV] = json.dumps(config)
+    
+    logger = setup_http_logging(args.log_level)
+    if logger:
+        logger.info(f"🌐 Starting RegonAPI HTTP MCP Server with {args.workers} workers "
+                    f"at http://{args.host}:{args.port}")
+    
+    # Run as a script the module is importable by its file name
+    module_name = __spec__.name if __spec__ is not None else os.path.splitext(os.path.basename(__file__))[0]
+    
+    try:
+        uvicorn.run(
+            f"{module_name}:app_factory",
+            factory=True,
+            host=args.host,
+            port=args.port,
+            workers=args.workers,
+            log_level=args.log_level.lower(),
+            loop="uvloop" if UVLOOP_AVAILABLE else "asyncio",
+            http="httptools" if HTTPTOOLS_AVAILABLE else "h11",
+            ws="none",            # WebSockets are not used
+            access_log=access_log_enabled(),
+            proxy_headers=False,  # Not deployed behind a trusted proxy by default
+            server_header=False,  # Security: hide server header
+            date_header=False,    # Security: hide date header
+            **connection_settings()
+        )
+        return 0
+    except Exception as e:
+        if logger:
+            logger.error(f"❌ Critical error in HTTP server workers: {e}", exc_info=True)
+        return 1
+
+@safe_execute
+def run_http_server(args: Optional[argparse.Namespace] = None) -> int:
+    """
+    Run the HTTP MCP server with comprehensive error handling and recovery.
+    
+    Each serve attempt goes through uvicorn.Server.run(), which creates the
+    event loop (uvloop when installed) itself; the restart backoff runs
+    between attempts with no loop alive.
+    """
+    global logger, config, http_server
     
     # Set up signal handlers for graceful shutdown
     setup_signal_handlers()
     
     try:
         # Parse command line arguments with validation
-        args = parse_http_arguments()
+        if args is None:
+            args = parse_http_arguments()
         if args is None:
             print("ERROR: Failed to parse arguments, exiting")
             return 1
@@ -774,7 +1085,9 @@ async def run_http_server() -> int:
             'log_level': args.log_level,
             'host': args.host,
             'port': args.port,
-            'tools_config': args.tools_config
+            'tools_config': args.tools_config,
+            'cors_origins': args.cors_origins,
+            'workers': args.workers
         })
         
         # Setup logging with error handling
@@ -796,21 +1109,27 @@ async def run_http_server() -> int:
         # Initialize the original server's logger
         stdio_server_module.logger = stdio_server_module.setup_logging(config['log_level'])
         
-        # Log startup information
-        mode = "production" if config['production_mode'] else "test"
-        tools_config = config['tools_config'] or 'default'
-        
-        logger.info("=" * 70)
-        logger.info("🌐 Starting RegonAPI HTTP MCP Server")
-        logger.info(f"   Host: {config['host']}")
-        logger.info(f"   Port: {config['port']}")
-        logger.info(f"   Mode: {mode}")
-        logger.info(f"   Log Level: {config['log_level']}")
-        logger.info(f"   Tools Config: {tools_config}")
-        logger.info(f"   Python Version: {sys.version}")
-        logger.info(f"   Platform: {sys.platform}")
-        logger.info(f"   Encoding: UTF-8 ✅")
-        logger.info("=" * 70)
+        # Log startup information as a single record
+        if logger.isEnabledFor(logging.INFO):
+            mode = "production" if config['production_mode'] else "test"
+            tools_config = config['tools_config'] or 'default'
+            
+            logger.info("\n".join([
+                "=" * 70,
+                "🌐 Starting RegonAPI HTTP MCP Server",
+                f"   Host: {config['host']}",
+                f"   Port: {config['port']}",
+                f"   Mode: {mode}",
+                f"   Log Level: {config['log_level']}",
+                f"   Tools Config: {tools_config}",
+                f"   Python Version: {sys.version}",
+                f"   Platform: {sys.platform}",
+                f"   Event Loop: {'uvloop' if UVLOOP_AVAILABLE else 'asyncio'}",
+                f"   HTTP Parser: {'httptools' if HTTPTOOLS_AVAILABLE else 'h11'}",
+                f"   CORS Origins: {', '.join(config['cors_origins']) or 'disabled'}",
+                "   Encoding: UTF-8 ✅",
+                "=" * 70,
+            ]))
         
         # Pre-flight checks
         if health_checker:
@@ -836,23 +1155,32 @@ async def run_http_server() -> int:
                 host=config['host'],
                 port=config['port'],
                 log_level=config['log_level'].lower(),
-                access_log=True,
+                loop="uvloop" if UVLOOP_AVAILABLE else "asyncio",
+                http="httptools" if HTTPTOOLS_AVAILABLE else "h11",
+                ws="none",            # WebSockets are not used
+                access_log=access_log_enabled(),
+                proxy_headers=False,  # Not deployed behind a trusted proxy by default
                 server_header=False,  # Security: hide server header
-                date_header=False     # Security: hide date header
+                date_header=False,    # Security: hide date header
+                **connection_settings()
             )
             
-            server = uvicorn.Server(uvicorn_config)
+            server = http_server = uvicorn.Server(uvicorn_config)
             logger.info("✅ Uvicorn server configured")
             
         except Exception as e:
             logger.error(f"Uvicorn configuration failed: {e}", exc_info=True)
             return 1
         
-        logger.info("🎯 HTTP Server ready to accept connections")
-        logger.info(f"✅ HTTP MCP Server starting at http://{config['host']}:{config['port']}")
-        logger.info(f"� API Documentation: http://{config['host']}:{config['port']}/docs")
-        logger.info(f"🔍 Health Check: http://{config['host']}:{config['port']}/health")
-        logger.info(f"🔍 Example: http://{config['host']}:{config['port']}/search/nip/7342867148")
+        if logger.isEnabledFor(logging.INFO):
+            base_url = f"http://{config['host']}:{config['port']}"
+            logger.info("\n".join([
+                "🎯 HTTP Server ready to accept connections",
+                f"✅ HTTP MCP Server starting at {base_url}",
+                f"📖 API Documentation: {base_url}/docs",
+                f"🔍 Health Check: {base_url}/health",
+                f"🔍 Example: {base_url}/search/nip/7342867148",
+            ]))
         
         # Run server with error recovery
         max_restarts = 3
@@ -861,7 +1189,7 @@ async def run_http_server() -> int:
         while restart_count < max_restarts:
             try:
                 logger.info("📡 HTTP MCP Server running...")
-                await server.serve()
+                server.run()
                 
                 # If we reach here, server shut down normally
                 logger.info("🛑 HTTP Server shut down normally")
@@ -872,24 +1200,30 @@ async def run_http_server() -> int:
                 break
                 
             except Exception as e:
+                if server.should_exit:
+                    logger.info("🛑 HTTP Server stopped during shutdown")
+                    break
                 restart_count += 1
-                logger.error(f"HTTP Server error (attempt {restart_count}/{max_restarts}): {e}", exc_info=True)
+                logger.error(f"HTTP Server error (attempt {restart_count}/{max_restarts}): {e}", exc_info=traceback_due())
                 
-                if restart_count < max_restarts:
-                    wait_time = min(5 * restart_count, 30)  # Exponential backoff, max 30s
-                    logger.info(f"🔄 Restarting HTTP server in {wait_time} seconds...")
-                    await asyncio.sleep(wait_time)
-                    
-                    # Recreate server instance
+                if restart_count >= max_restarts:
+                    logger.error("❌ Maximum restart attempts reached, exiting")
+                    return 1
+                
+                # Exponential backoff with jitter, max 30s
+                wait_time = min(2 ** restart_count + random.uniform(0, 1), 30)
+                logger.info(f"🔄 Restarting HTTP server in {wait_time:.1f} seconds...")
+                time.sleep(wait_time)
+                
+                # A server that never finished startup can be served again as is;
+                # one that was running carries shutdown state and is recreated
+                if server.started:
                     try:
-                        server = uvicorn.Server(uvicorn_config)
+                        server = http_server = uvicorn.Server(uvicorn_config)
                         logger.info("✅ Server instance recreated")
                     except Exception as recreate_error:
                         logger.error(f"Failed to recreate server: {recreate_error}")
                         break
-                else:
-                    logger.error("❌ Maximum restart attempts reached, exiting")
-                    return 1
         
         return 0
         
@@ -927,7 +1261,16 @@ def main():
     global logger
     
     try:
-        exit_code = asyncio.run(run_http_server())
+        args = parse_http_arguments()
+        if args is None:
+            print("ERROR: Failed to parse arguments, exiting")
+            sys.exit(1)
+        
+        # Several workers are separate processes managed by uvicorn itself
+        if args.workers > 1:
+            sys.exit(run_http_workers(args))
+        
+        exit_code = run_http_server(args)
         sys.exit(exit_code)
     except KeyboardInterrupt:
         print("\n🛑 HTTP Server stopped by user")
@@ -5,13 +5,23 @@ Handles loading and managing customizable tool descriptions and configurations.
 """
 
 import json
+import mmap
 import os
 import logging
+from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
 import sys
 
+# orjson is optional; it parses the larger tool configs noticeably faster
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 def app_dir() -> Path:
     # Directory of the running app (exe dir when frozen, script dir otherwise)
     if getattr(sys, "frozen", False):      # PyInstaller sets this
@@ -20,6 +30,123 @@ def app_dir() -> Path:
 
 logger = logging.getLogger(__name__)
 
+# Parsed configuration files keyed by path. An entry is reused only while the
+# file's (mtime_ns, size) is unchanged, so edits on disk are still picked up.
+# Every caller gets the same dict, so the parsed data must never be modified.
+_parsed_cache: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+
+# Discovered configurations keyed by directory, valid while the directory's
+# mtime is unchanged (adding or removing a file updates it)
+_discovery_cache: Dict[str, Tuple[int, Dict[str, str]]] = {}
+
+# Files above this size are parsed straight from a read-only memory map
+MMAP_THRESHOLD = 16 * 1024
+
+def _parse_mapped(config_file: str) -> Dict[str, Any]:
+    """
+    Parse a JSON file with orjson through a read-only memory map.
+    
+    Args:
+        config_file: Path to the JSON file
+        
+    Returns:
+        Parsed configuration dictionary
+    """
+    fd = os.open(config_file, os.O_RDONLY)
+    try:
+        mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    finally:
+        os.close(fd)
+    try:
+        # The view must be released before the map can be closed
+        with memoryview(mm) as view:
+            return orjson.loads(view)
+    finally:
+        mm.close()
+
+def _load_json_cached(config_file: str) -> Dict[str, Any]:
+    """
+    Parse a JSON configuration file, reusing the previous result if the file is unchanged.
+    
+    Args:
+        config_file: Path to the JSON file
+        
+    Returns:
+        Parsed configuration dictionary, shared with every other caller; read-only
+    """
+    stat = os.stat(config_file)
+    cached = _parsed_cache.get(config_file)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+    
+    if ORJSON_AVAILABLE and stat.st_size > MMAP_THRESHOLD:
+        config = _parse_mapped(config_file)
+    elif ORJSON_AVAILABLE:
+        # orjson takes the UTF-8 bytes directly; its JSONDecodeError subclasses json's
+        with open(config_file, 'rb') as f:
+            config = orjson.loads(f.read())
+    else:
+        with open(config_file, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+    
+    _parsed_cache[config_file] = (stat.st_mtime_ns, stat.st_size, config)
+    return config
+
+def _canonical_name(config_name: str) -> str:
+    """
+    Normalize a configuration name for lookups.
+    
+    Args:
+        config_name: Configuration name as given by a user or a file name
+        
+    Returns:
+        The name stripped of surrounding whitespace and lowercased
+    """
+    return config_name.strip().lower()
+
+@dataclass(frozen=True)
+class ServerInfo:
+    """Immutable snapshot of the server metadata in a tool configuration."""
+    
+    name: str = 'RegonAPI MCP Server'
+    version: str = '1.0.0'
+    description: str = 'Polish REGON database access'
+    language: str = 'en'
+    capabilities: Dict[str, Any] = field(default_factory=dict)
+    serverInfo: Dict[str, Any] = field(default_factory=dict)
+    
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "ServerInfo":
+        """
+        Build the snapshot from a parsed configuration, applying the defaults.
+        
+        Args:
+            config: Parsed tool configuration dictionary
+            
+        Returns:
+            ServerInfo instance
+        """
+        defaults = cls()
+        return cls(
+            name=config.get('name', defaults.name),
+            version=config.get('version', defaults.version),
+            description=config.get('description', defaults.description),
+            language=config.get('language', defaults.language),
+            capabilities=config.get('capabilities', {}),
+            serverInfo=config.get('serverInfo', {})
+        )
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a new dictionary in the shape used by the servers; callers may modify it."""
+        return {
+            'name': self.name,
+            'version': self.version,
+            'description': self.description,
+            'language': self.language,
+            'capabilities': dict(self.capabilities),
+            'serverInfo': dict(self.serverInfo)
+        }
+
 class ToolConfigLoader:
     """Loads and manages tool configurations from JSON files."""
     
@@ -32,29 +159,49 @@ class ToolConfigLoader:
         """
         self.config_dir = Path(config_dir)
         if not self.config_dir.exists():
-            logger.warning(f"Config directory at {self.config_dir} does not exist")
+            logger.warning("Config directory at %s does not exist", self.config_dir)
             self.config_dir = Path( app_dir() / "config" )
-            logger.warning(f"Using fallback config directory: {self.config_dir}")
-        logger.info(f"Tool configuration directory: {self.config_dir}")
+            logger.warning("Using fallback config directory: %s", self.config_dir)
+        logger.info("Tool configuration directory: %s", self.config_dir)
         
         self.config = None
-        self.available_configs = self._discover_configs()
+        self._tools_by_name: Dict[str, Dict[str, Any]] = {}
+        self._tools_list: Tuple[Dict[str, Any], ...] = ()
+        self._server_info: Optional[ServerInfo] = None
+    
+    @cached_property
+    def available_configs(self) -> Dict[str, str]:
+        """Available configuration files, discovered on first access."""
+        return self._discover_configs()
+    
+    @cached_property
+    def available_config_names(self) -> Tuple[str, ...]:
+        """Names of the discovered configurations, computed once alongside them."""
+        return tuple(self.available_configs)
         
     def _discover_configs(self) -> Dict[str, str]:
         """Discover available configuration files."""
         configs = {}
         
         if not self.config_dir.exists():
-            logger.warning(f"Current working directory: {os.getcwd()}")
-            logger.warning(f"Config directory {self.config_dir} does not exist")
+            logger.warning("Current working directory: %s", os.getcwd())
+            logger.warning("Config directory %s does not exist", self.config_dir)
             return configs
+        
+        cache_key = str(self.config_dir)
+        dir_mtime = self.config_dir.stat().st_mtime_ns
+        cached = _discovery_cache.get(cache_key)
+        if cached is not None and cached[0] == dir_mtime:
+            return dict(cached[1])
             
         for config_file in self.config_dir.glob("tools_*.json"):
-            config_name = config_file.stem.replace("tools_", "")
+            config_name = _canonical_name(config_file.stem.replace("tools_", "", 1))
             configs[config_name] = str(config_file)
-            
-        logger.info(f"Discovered tool configurations: {list(configs.keys())}")
-        return configs
+        
+        _discovery_cache[cache_key] = (dir_mtime, configs)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Discovered tool configurations: %s", list(configs))
+        return dict(configs)
     
     def load_config(self, config_name: str = None) -> Dict[str, Any]:
         """
@@ -65,24 +212,17 @@ class ToolConfigLoader:
                         If None, will use environment variable TOOLS_CONFIG or 'detailed'
         
         Returns:
-            Loaded configuration dictionary
+            Loaded configuration dictionary. It is shared through the parse cache,
+            so treat it as read-only; copy it before making changes.
         """
         if config_name is None:
             config_name = os.getenv('TOOLS_CONFIG', 'detailed')
             
-        # Try to load the requested config
-        config_file = None
-        
-        if config_name in self.available_configs:
-            config_file = self.available_configs[config_name]
-        else:
-            # Fallback to tools_{config_name}.json
-            potential_file = self.config_dir / f"tools_{config_name}.json"
-            if potential_file.exists():
-                config_file = str(potential_file)
+        # Discovered names are canonical, so this is one lookup
+        config_file = self.available_configs.get(_canonical_name(config_name))
         
         if config_file is None:
-            logger.warning(f"Config '{config_name}' not found, falling back to 'detailed'")
+            logger.warning("Config '%s' not found, falling back to 'detailed'", config_name)
             # Fallback to detailed config
             if 'detailed' in self.available_configs:
                 config_file = self.available_configs['detailed']
@@ -95,12 +235,21 @@ class ToolConfigLoader:
                     raise FileNotFoundError(f"No tool configuration found for '{config_name}' and no fallback available")
         
         try:
-            with open(config_file, 'r', encoding='utf-8') as f:
-                self.config = json.load(f)
+            self.config = _load_json_cached(config_file)
+            
+            # Index tools by name and drop derived data from the previous config
+            self._tools_by_name = {
+                tool['name']: tool
+                for tool in self.config.get('tools', [])
+                if isinstance(tool, dict) and 'name' in tool
+            }
+            # Snapshot the derived data once so the getters are plain attribute reads
+            self._tools_list = tuple(self.config.get('tools', []))
+            self._server_info = ServerInfo.from_config(self.config)
             
-            logger.info(f"Loaded tool configuration: {config_name} ({config_file})")
-            logger.info(f"Configuration language: {self.config.get('language', 'unknown')}")
-            logger.info(f"Number of tools: {len(self.config.get('tools', []))}")
+            logger.info("Loaded tool configuration: %s (%s)", config_name, config_file)
+            logger.info("Configuration language: %s", self.config.get('language', 'unknown'))
+            logger.info("Number of tools: %d", len(self._tools_list))
             
             return self.config
             
@@ -124,51 +273,47 @@ class ToolConfigLoader:
         if self.config is None:
             self.load_config()
             
-        for tool in self.config.get('tools', []):
-            if tool.get('name') == tool_name:
-                return tool
-                
-        return None
+        return self._tools_by_name.get(tool_name)
     
-    def get_all_tools(self) -> List[Dict[str, Any]]:
+    def get_all_tools(self) -> Tuple[Dict[str, Any], ...]:
         """
         Get all tool configurations.
         
         Returns:
-            List of tool configuration dictionaries
+            Tuple of tool configuration dictionaries
         """
         if self.config is None:
             self.load_config()
             
-        return self.config.get('tools', [])
+        return self._tools_list
     
     def get_server_info(self) -> Dict[str, Any]:
         """
         Get server information from configuration.
         
         Returns:
-            Server info dictionary
+            Server info dictionary, a fresh copy of the loaded snapshot
         """
         if self.config is None:
             self.load_config()
-            
-        return {
-            'name': self.config.get('name', 'RegonAPI MCP Server'),
-            'version': self.config.get('version', '1.0.0'),
-            'description': self.config.get('description', 'Polish REGON database access'),
-            'language': self.config.get('language', 'en'),
-            'capabilities': self.config.get('capabilities', {}),
-            'serverInfo': self.config.get('serverInfo', {})
-        }
+        
+        return self._server_info.as_dict()
     
-    def list_available_configs(self) -> List[str]:
+    @property
+    def server_info(self) -> ServerInfo:
+        """Server metadata of the loaded configuration as a frozen snapshot."""
+        if self.config is None:
+            self.load_config()
+        return self._server_info
+    
+    def list_available_configs(self) -> Tuple[str, ...]:
         """
         List all available configuration names.
         
         Returns:
-            List of configuration names
+            Tuple of configuration names
         """
-        return list(self.available_configs.keys())
+        return self.available_config_names
     
     def get_config_info(self, config_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -180,14 +325,12 @@ class ToolConfigLoader:
         Returns:
             Basic configuration info or None if not found
         """
-        if config_name not in self.available_configs:
+        config_file = self.available_configs.get(_canonical_name(config_name))
+        if config_file is None:
             return None
-            
-        config_file = self.available_configs[config_name]
         
         try:
-            with open(config_file, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            config = _load_json_cached(config_file)
                 
             return {
                 'name': config.get('name', 'Unknown'),
@@ -198,15 +341,15 @@ class ToolConfigLoader:
                 'file_path': config_file
             }
         except Exception as e:
-            logger.error(f"Error reading config info for {config_name}: {e}")
+            logger.error("Error reading config info for %s: %s", config_name, e)
             return None
 
-# Global instance for the module
-_config_loader = None
+# Loader instances for the module, one per configuration directory
+_config_loaders: Dict[str, ToolConfigLoader] = {}
 
 def get_config_loader(config_dir: str = "config") -> ToolConfigLoader:
     """
-    Get the global configuration loader instance.
+    Get the configuration loader instance for a directory.
     
     Args:
         config_dir: Directory containing configuration files
@@ -214,10 +357,10 @@ def get_config_loader(config_dir: str = "config") -> ToolConfigLoader:
     Returns:
         ToolConfigLoader instance
     """
-    global _config_loader
-    if _config_loader is None:
-        _config_loader = ToolConfigLoader(config_dir)
-    return _config_loader
+    loader = _config_loaders.get(config_dir)
+    if loader is None:
+        loader = _config_loaders[config_dir] = ToolConfigLoader(config_dir)
+    return loader
 
 def load_tools_config(config_name: str = None) -> Dict[str, Any]:
     """
@@ -227,17 +370,17 @@ def load_tools_config(config_name: str = None) -> Dict[str, Any]:
         config_name: Name of the configuration to load
         
     Returns:
-        Loaded configuration dictionary
+        Loaded configuration dictionary (read-only, see ToolConfigLoader.load_config)
     """
     loader = get_config_loader()
     return loader.load_config(config_name)
 
-def get_available_tool_configs() -> List[str]:
+def get_available_tool_configs() -> Tuple[str, ...]:
     """
-    Get list of available tool configuration names.
+    Get the available tool configuration names.
     
     Returns:
-        List of configuration names
+        Tuple of configuration names
     """
     loader = get_config_loader()
     return loader.list_available_configs()
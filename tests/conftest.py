@@ -8,16 +8,29 @@ for all test modules in the project.
 import asyncio
 import json
 import os
+import subprocess
 import sys
+import time
+import types
 from pathlib import Path
 from typing import Dict, Any, Optional
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+import requests
 from dotenv import load_dotenv
 
-# Configure UTF-8 encoding for proper Unicode handling
+# orjson is optional; fall back to the standard library when it is missing
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Configure UTF-8 encoding for proper Unicode handling; subprocesses
+# spawned by the tests inherit both settings
 os.environ['PYTHONIOENCODING'] = 'utf-8'
+os.environ.setdefault('PYTHONUTF8', '1')
 
 # Add the project root to Python path for imports
 project_root = Path(__file__).parent.parent
@@ -28,18 +41,21 @@ load_dotenv()
 
 # Mock RegonAPI module since it might not be available in test environment
 class MockRegonAPI:
-    """Mock RegonAPI for testing purposes."""
+    """Mock RegonAPI for testing purposes.
+    
+    Methods are synchronous like the real client; nothing here awaits.
+    """
     
     def __init__(self, *args, **kwargs):
         self.session = MagicMock()
         self.is_authenticated = False
         
-    async def authenticate(self):
+    def authenticate(self):
         """Mock authentication."""
         self.is_authenticated = True
         return True
         
-    async def search_by_nip(self, nip):
+    def search_by_nip(self, nip):
         """Mock NIP search."""
         return {
             "nip": nip,
@@ -48,7 +64,7 @@ class MockRegonAPI:
             "status": "AKTYWNY"
         }
         
-    async def search_by_regon(self, regon):
+    def search_by_regon(self, regon):
         """Mock REGON search."""
         return {
             "regon": regon,
@@ -57,7 +73,7 @@ class MockRegonAPI:
             "status": "AKTYWNY"
         }
         
-    async def search_by_krs(self, krs):
+    def search_by_krs(self, krs):
         """Mock KRS search."""
         return {
             "krs": krs,
@@ -67,7 +83,7 @@ class MockRegonAPI:
             "status": "AKTYWNY"
         }
         
-    async def get_full_report(self, regon):
+    def get_full_report(self, regon):
         """Mock full report."""
         return {
             "regon": regon,
@@ -77,11 +93,9 @@ class MockRegonAPI:
             "city": "Test City"
         }
 
-# Add the mock to sys.modules so imports work
-sys.modules['RegonAPI'] = type('MockModule', (), {'RegonAPI': MockRegonAPI})()
 
-# Configure UTF-8 encoding for Windows console output
-if sys.platform == "win32":
+# Configure UTF-8 encoding for Windows console output, unless it already is
+if sys.platform == "win32" and (sys.stdout.encoding or "").lower().replace("-", "") != "utf8":
     try:
         sys.stdout.reconfigure(encoding='utf-8')
         sys.stderr.reconfigure(encoding='utf-8')
@@ -92,6 +106,24 @@ if sys.platform == "win32":
         sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer)
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _install_regon_mock():
+    """Expose MockRegonAPI as the RegonAPI module unless the real package is installed."""
+    try:
+        import RegonAPI  # noqa: F401
+        installed = False
+    except ImportError:
+        mock_module = types.ModuleType('RegonAPI')
+        mock_module.RegonAPI = MockRegonAPI
+        sys.modules['RegonAPI'] = mock_module
+        installed = True
+    
+    yield
+    
+    if installed:
+        sys.modules.pop('RegonAPI', None)
+
+
 @pytest.fixture(scope="session")
 def project_root_path():
     """Return the project root directory path."""
@@ -110,6 +142,67 @@ def production_api_key():
     return os.getenv('API_KEY')
 
 
+@pytest.fixture(scope="session")
+def mcp_config():
+    """Return the parsed mcp.json client configuration, read once per session."""
+    data = (project_root / "mcp.json").read_bytes()
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
+@pytest.fixture(scope="session")
+def env_content():
+    """Return the text of the project .env file, or an empty string without one."""
+    env_file = project_root / ".env"
+    return env_file.read_text(encoding="utf-8") if env_file.exists() else ""
+
+
+@pytest.fixture(scope="session")
+def http_server_process():
+    """Start one HTTP server per test process and return its base URL.
+    
+    Under pytest-xdist every worker gets its own server on its own port
+    (8100 + worker number), so parallel workers never compete for a port.
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    port = 8100 + int(worker.lstrip("gw") or 0)
+    base_url = f"http://127.0.0.1:{port}"
+    
+    process = subprocess.Popen([
+        sys.executable, str(project_root / "regon_mcp_server" / "server_http.py"),
+        "--host", "127.0.0.1",
+        "--port", str(port),
+        "--log-level", "WARNING"
+    ], cwd=project_root, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    
+    # Poll until the server answers /health; a refused connection returns
+    # at once, and the first health check may take a moment to complete
+    deadline = time.monotonic() + 15
+    with requests.Session() as session:
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                _, stderr = process.communicate()
+                pytest.fail(f"HTTP server failed to start: {stderr.decode()}")
+            try:
+                if session.get(f"{base_url}/health", timeout=5).status_code == 200:
+                    break
+            except requests.exceptions.RequestException:
+                pass
+            time.sleep(0.05)
+        else:
+            process.kill()
+            process.wait()
+            pytest.fail("HTTP server did not become ready within 15s")
+    
+    yield base_url
+    
+    # Cleanup
+    process.terminate()
+    try:
+        process.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        process.kill()
+
+
 @pytest.fixture
 def mock_regon_api():
     """Mock RegonAPI for testing without actual API calls."""
@@ -328,6 +421,10 @@ def pytest_configure(config):
 def pytest_collection_modifyitems(config, items):
     """Modify test collection to add markers based on test names and paths."""
     for item in items:
+        # Async tests share the session loop; clean up the tasks they leave behind
+        if item.get_closest_marker("asyncio") is not None:
+            item.fixturenames.append("_cancel_leftover_tasks")
+        
         # Add markers based on test file names
         if "test_http" in item.fspath.basename:
             item.add_marker(pytest.mark.http)
@@ -348,10 +445,27 @@ def pytest_collection_modifyitems(config, items):
             item.add_marker(pytest.mark.unit)
 
 
-# Event loop configuration for async tests
+# Event loop configuration for async tests; pytest.ini runs every async test
+# and fixture on one session-scoped loop, created from this policy
 @pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
+def event_loop_policy():
+    """Return the event loop policy for the test session, uvloop when it is installed."""
+    try:
+        import uvloop
+        return uvloop.EventLoopPolicy()
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+
+
+# Added to asyncio-marked tests by pytest_collection_modifyitems
+@pytest.fixture
+async def _cancel_leftover_tasks():
+    """Cancel tasks a test started and left running, so they cannot leak into the next test on the shared loop."""
+    before = asyncio.all_tasks()
+    yield
+    current = asyncio.current_task()
+    leftover = [task for task in asyncio.all_tasks() - before if task is not current and not task.done()]
+    for task in leftover:
+        task.cancel()
+    if leftover:
+        await asyncio.gather(*leftover, return_exceptions=True)
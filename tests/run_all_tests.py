@@ -10,19 +10,24 @@ Usage:
 """
 
 import asyncio
-import subprocess
+import contextvars
+import hashlib
+import importlib.util
+import inspect
+import io
 import sys
 import os
+import socket
 import time
-import requests
 import argparse
 from pathlib import Path
 
 # Configure UTF-8 encoding for proper Unicode handling
-os.environ['PYTHONIOENCODING'] = 'utf-8'
+if os.environ.get('PYTHONIOENCODING', '').lower() != 'utf-8':
+    os.environ['PYTHONIOENCODING'] = 'utf-8'
 
-# Configure UTF-8 encoding for Windows console output
-if sys.platform == "win32":
+# Configure UTF-8 encoding for Windows console output, unless it already is
+if sys.platform == "win32" and (sys.stdout.encoding or "").lower().replace("-", "") != "utf8":
     try:
         sys.stdout.reconfigure(encoding='utf-8')
         sys.stderr.reconfigure(encoding='utf-8')
@@ -60,6 +65,50 @@ def print_header(title):
     print(f"🧪 {title}")
     print("=" * 60)
 
+# Output buffer of the suite running in the current task; None means the console
+_suite_output: contextvars.ContextVar = contextvars.ContextVar('suite_output', default=None)
+
+class SuiteStdout:
+    """sys.stdout stand-in that sends each suite's prints to that suite's buffer."""
+    
+    def __init__(self, stream):
+        self._stream = stream
+    
+    def write(self, text):
+        buffer = _suite_output.get()
+        return (buffer if buffer is not None else self._stream).write(text)
+    
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+async def run_suite(runner, *args):
+    """
+    Run a test suite in this interpreter, capturing its console output.
+    
+    Synchronous entry points run in a worker thread so that suites can be
+    awaited concurrently.
+    
+    Args:
+        runner: Suite entry point, a coroutine function or a plain function
+        *args: Arguments passed to the entry point
+        
+    Returns:
+        Tuple of (passed, captured output)
+    """
+    output = io.StringIO()
+    token = _suite_output.set(output)
+    try:
+        if inspect.iscoroutinefunction(runner):
+            await runner(*args)
+        else:
+            await asyncio.to_thread(runner, *args)
+        return True, output.getvalue()
+    except Exception as e:
+        output.write(f"{type(e).__name__}: {e}\n")
+        return False, output.getvalue()
+    finally:
+        _suite_output.reset(token)
+
 def print_section(title):
     """Print a formatted test subsection."""
     print(f"\n📋 {title}")
@@ -67,124 +116,142 @@ def print_section(title):
 
 async def test_stdio_server():
     """Test the stdio MCP server."""
-    print_section("Stdio MCP Server Tests")
-    
-    # Change to project root if needed
-    original_dir = os.getcwd()
-    if 'tests' in os.getcwd():
-        os.chdir('..')
-    
     try:
         # Run stdio server test
-        result = subprocess.run([
-            sys.executable, "tests/test_stdio_server.py"
-        ], capture_output=True, text=True)
+        # The suites run inside this interpreter; each is imported only when it runs
+        import test_stdio_server as stdio_suite
+        passed, output = await run_suite(stdio_suite.test_server_functionality)
         
-        if result.returncode == 0:
+        print_section("Stdio MCP Server Tests")
+        if passed:
             print("✅ Stdio server tests PASSED")
             return True
         else:
             print("❌ Stdio server tests FAILED")
-            print(result.stderr)
+            print(output)
             return False
     except Exception as e:
         print(f"❌ Stdio server test error: {e}")
         return False
-    finally:
-        os.chdir(original_dir)
 
 async def test_mcp_protocol():
     """Test MCP protocol compliance."""
-    print_section("MCP Protocol Compliance Tests")
-    
-    original_dir = os.getcwd()
-    if 'tests' in os.getcwd():
-        os.chdir('..')
-    
     try:
-        result = subprocess.run([
-            sys.executable, "tests/test_mcp_protocol.py"
-        ], capture_output=True, text=True)
+        import test_mcp_protocol as protocol_suite
+        passed, output = await run_suite(protocol_suite.test_mcp_server)
         
-        if result.returncode == 0:
+        print_section("MCP Protocol Compliance Tests")
+        if passed:
             print("✅ MCP protocol tests PASSED")
             return True
         else:
             print("❌ MCP protocol tests FAILED")
-            print(result.stderr)
+            print(output)
             return False
     except Exception as e:
         print(f"❌ MCP protocol test error: {e}")
         return False
-    finally:
-        os.chdir(original_dir)
+
+def server_listening(port, host="localhost"):
+    """
+    Check whether something accepts TCP connections on the given port.
+    
+    Args:
+        port: Port to probe
+        host: Host to probe
+        
+    Returns:
+        True if a connection could be opened
+    """
+    try:
+        with socket.create_connection((host, port), timeout=0.2):
+            return True
+    except OSError:
+        return False
 
 async def test_http_server(port=8001):
     """Test the HTTP MCP server."""
-    print_section("HTTP MCP Server Tests")
-    
-    original_dir = os.getcwd()
-    if 'tests' in os.getcwd():
-        os.chdir('..')
-    
     try:
         # Check if HTTP server is already running
-        try:
-            response = requests.get(f"http://localhost:{port}/health", timeout=2)
-            server_running = response.status_code == 200
-        except:
-            server_running = False
+        server_running = server_listening(port)
         
         if not server_running:
+            print_section("HTTP MCP Server Tests")
             print(f"⚠️  HTTP server not running on port {port}. Please start it manually:")
             print(f"   .\\venv\\Scripts\\python.exe regon_mcp_server\\server_http.py --port {port}")
             print("\nThen run HTTP tests separately:")
             print(f"   .\\venv\\Scripts\\python.exe tests\\test_http_server.py --port {port}")
             return False
         
-        # Run HTTP server test
-        result = subprocess.run([
-            sys.executable, "tests/test_http_server.py", "--port", str(port)
-        ], capture_output=True, text=True)
+        # Run HTTP server test; imported here since it pulls in requests
+        import test_http_server as http_suite
+        passed, output = await run_suite(http_suite.main, port)
         
-        if result.returncode == 0:
+        print_section("HTTP MCP Server Tests")
+        if passed:
             print("✅ HTTP server tests PASSED")
             return True
         else:
             print("❌ HTTP server tests FAILED")
-            print(result.stderr)
+            print(output)
             return False
     except Exception as e:
         print(f"❌ HTTP server test error: {e}")
         return False
-    finally:
-        os.chdir(original_dir)
+
+# Paths are resolved against the project root instead of changing directory
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+ENV_MARKER_DIR = PROJECT_ROOT / ".pytest_cache"
+
+def environment_marker():
+    """
+    Marker file recording a passed environment check for the current requirements.
+    
+    Returns:
+        Path of the marker, or None when requirements.txt is missing
+    """
+    try:
+        key = hashlib.sha1((PROJECT_ROOT / "requirements.txt").read_bytes()).hexdigest()
+    except OSError:
+        return None
+    return ENV_MARKER_DIR / f"env_ok_{key}"
 
 def check_environment():
     """Check if the environment is properly set up."""
     print_section("Environment Check")
     
+    # A previous run already verified this set of requirements
+    marker = environment_marker()
+    if marker is not None and marker.exists():
+        print("✅ Environment check PASSED (cached)")
+        return True
+    
     # Check if we're in the right directory
-    if not os.path.exists("regon_mcp_server"):
+    if not (PROJECT_ROOT / "regon_mcp_server").exists():
         print("❌ Not in project root directory")
         return False
     
     # Check if virtual environment is active or available
-    venv_python = Path(".venv/Scripts/python.exe")
+    venv_python = PROJECT_ROOT / ".venv" / "Scripts" / "python.exe"
     if not venv_python.exists():
         print("❌ Virtual environment not found at .venv/Scripts/python.exe")
         return False
     
-    # Check if required modules are installed
-    try:
-        import mcp
-        import fastapi
-        import uvicorn
-        import requests
-        print("✅ All required modules are installed")
-    except ImportError as e:
-        print(f"❌ Missing required module: {e}")
+    # Check if required modules are installed, without importing them
+    missing = [name for name in ("mcp", "fastapi", "uvicorn", "requests")
+               if importlib.util.find_spec(name) is None]
+    if missing:
+        print(f"❌ Missing required module: {', '.join(missing)}")
         return False
+    print("✅ All required modules are installed")
+    
+    if marker is not None:
+        try:
+            marker.parent.mkdir(exist_ok=True)
+            marker.touch()
+        except OSError:
+            pass
     
     print("✅ Environment check PASSED")
     return True
@@ -197,11 +264,6 @@ async def main():
     print_header("REGON MCP Server Test Suite")
     print(f"🌐 HTTP Server Port: {args.port}")
     
-    # Change to project root if needed
-    original_dir = os.getcwd()
-    if 'tests' in os.getcwd():
-        os.chdir('..')
-    
     try:
         # Environment check
         if not check_environment():
@@ -215,17 +277,21 @@ async def main():
             "http_server": False
         }
         
-        # Run stdio server tests
-        print_header("Testing Stdio MCP Server")
-        results["stdio_server"] = await test_stdio_server()
-        
-        # Run MCP protocol tests
-        print_header("Testing MCP Protocol Compliance")
-        results["mcp_protocol"] = await test_mcp_protocol()
-        
-        # Run HTTP server tests
-        print_header("Testing HTTP MCP Server")
-        results["http_server"] = await test_http_server(port=args.port)
+        # The suites share no state, so they run concurrently; each one's
+        # output is buffered and printed together once it finishes
+        print_header("Running Test Suites")
+        console = sys.stdout
+        sys.stdout = SuiteStdout(console)
+        try:
+            (results["stdio_server"],
+             results["mcp_protocol"],
+             results["http_server"]) = await asyncio.gather(
+                test_stdio_server(),
+                test_mcp_protocol(),
+                test_http_server(port=args.port)
+            )
+        finally:
+            sys.stdout = console
         
         # Summary
         print_header("Test Results Summary")
@@ -251,11 +317,16 @@ async def main():
         
     except Exception as e:
         print(f"\n❌ Test suite error: {e}")
-    finally:
-        os.chdir(original_dir)
 
 if __name__ == "__main__":
     try:
+        # uvloop is optional; it speeds up the suites' subprocess pipe I/O
+        if sys.platform != "win32":
+            try:
+                import uvloop
+                asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+            except ImportError:
+                pass
         asyncio.run(main())
     except KeyboardInterrupt:
         print("\n🛑 Test suite interrupted by user")
@@ -17,19 +17,25 @@ Examples:
     python tests/run_pytest.py --coverage         # Run with coverage report
     python tests/run_pytest.py --verbose          # Verbose output
     python tests/run_pytest.py --fast             # Skip slow tests
+    python tests/run_pytest.py --no-result-cache  # Re-run even if nothing changed
+    python tests/run_pytest.py --lf               # Re-run only last failures
+    python tests/run_pytest.py --ff --fast        # Failures first, stop at the first one
 """
 
 import argparse
+import hashlib
 import os
 import subprocess
 import sys
+import time
 from pathlib import Path
 
 # Configure UTF-8 encoding
-os.environ['PYTHONIOENCODING'] = 'utf-8'
+if os.environ.get('PYTHONIOENCODING', '').lower() != 'utf-8':
+    os.environ['PYTHONIOENCODING'] = 'utf-8'
 
-# Configure UTF-8 encoding for Windows console output
-if sys.platform == "win32":
+# Configure UTF-8 encoding for Windows console output, unless it already is
+if sys.platform == "win32" and (sys.stdout.encoding or "").lower().replace("-", "") != "utf8":
     try:
         sys.stdout.reconfigure(encoding='utf-8')
         sys.stderr.reconfigure(encoding='utf-8')
@@ -38,6 +44,44 @@ if sys.platform == "win32":
         sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer)
         sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer)
 
+# Markers of passed runs, keyed by a digest of the sources and the pytest command
+RESULT_CACHE_DIR = Path(".pytest_cache")
+RESULT_MARKER_PREFIX = "success_"
+RESULT_MARKER_MAX_AGE = 7 * 24 * 3600
+
+# Files whose contents decide a test outcome (relative to the project root)
+RESULT_CACHE_SOURCES = ('regon_mcp_server/**/*.py', 'tests/**/*.py', 'config/*.json', 'pytest.ini')
+
+
+def result_digest(pytest_cmd):
+    """
+    Hash the sources and the selected pytest command.
+    
+    Args:
+        pytest_cmd: The pytest command line that would be run
+        
+    Returns:
+        Hex digest identifying this run
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    paths = sorted({path for pattern in RESULT_CACHE_SOURCES for path in Path('.').glob(pattern)})
+    for path in paths:
+        digest.update(str(path).encode('utf-8'))
+        digest.update(path.read_bytes())
+    digest.update("\0".join(pytest_cmd).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def sweep_result_markers():
+    """Remove result markers older than RESULT_MARKER_MAX_AGE."""
+    cutoff = time.time() - RESULT_MARKER_MAX_AGE
+    for marker in RESULT_CACHE_DIR.glob(f"{RESULT_MARKER_PREFIX}*"):
+        try:
+            if marker.stat().st_mtime < cutoff:
+                marker.unlink()
+        except OSError:
+            pass
+
 
 def run_pytest(args):
     """Run pytest with the specified arguments."""
@@ -49,8 +93,15 @@ def run_pytest(args):
         os.chdir(project_root)
     
     try:
-        # Build pytest command
-        pytest_cmd = [sys.executable, '-m', 'pytest']
+        # Build pytest command. Plugin autoloading is disabled (see below), so
+        # the plugins this suite needs are named explicitly: pytest.ini relies
+        # on pytest-asyncio (asyncio_mode) and pytest-cov (--cov in addopts).
+        pytest_cmd = [
+            sys.executable, '-m', 'pytest',
+            '-p', 'pytest_asyncio.plugin',
+            '-p', 'pytest_cov.plugin',
+            '--import-mode=importlib'
+        ]
         
         # Add test selection arguments
         if args.unit:
@@ -68,6 +119,15 @@ def run_pytest(args):
         if args.fast:
             pytest_cmd.extend(['-m', 'not slow'])
         
+        # Re-run or prioritise the tests that failed last time; in fast mode
+        # stop at the first failure and resume from it on the next run
+        if args.lf:
+            pytest_cmd.append('--lf')
+        elif args.ff:
+            pytest_cmd.append('--ff')
+        if (args.lf or args.ff) and args.fast:
+            pytest_cmd.append('--stepwise')
+        
         # Add output arguments
         if args.verbose:
             pytest_cmd.append('-v')
@@ -82,9 +142,10 @@ def run_pytest(args):
                 '--cov-report=html:htmlcov'
             ])
         
-        # Add parallel execution if requested
+        # Add parallel execution if requested; each file stays on one worker
+        # so module and class fixtures are set up once
         if args.parallel:
-            pytest_cmd.extend(['-n', 'auto'])
+            pytest_cmd.extend(['-p', 'xdist.plugin', '-n', 'auto', '--dist', 'loadfile'])
         
         # Add specific test files if provided
         if args.test_files:
@@ -100,8 +161,28 @@ def run_pytest(args):
         print(" ".join(pytest_cmd))
         print("=" * 60)
         
-        # Run pytest
-        result = subprocess.run(pytest_cmd)
+        # Nothing relevant changed since the last passing run of this selection
+        marker = None
+        if not args.no_result_cache:
+            marker = RESULT_CACHE_DIR / f"{RESULT_MARKER_PREFIX}{result_digest(pytest_cmd)}"
+            if marker.exists():
+                print("✅ cached PASS (sources unchanged since the last passing run)")
+                return 0
+        
+        # Run pytest without scanning site-packages for entry point plugins.
+        # Descriptors are non-inheritable by default (PEP 446), so close_fds
+        # can be off, which lets POSIX systems start pytest via posix_spawn.
+        env = {**os.environ, 'PYTEST_DISABLE_PLUGIN_AUTOLOAD': '1'}
+        result = subprocess.run(pytest_cmd, env=env, close_fds=False)
+        
+        if result.returncode == 0 and marker is not None:
+            try:
+                RESULT_CACHE_DIR.mkdir(exist_ok=True)
+                marker.touch()
+                sweep_result_markers()
+            except OSError:
+                pass
+        
         return result.returncode
         
     finally:
@@ -148,6 +229,19 @@ def main():
         '--parallel', action='store_true',
         help='Run tests in parallel using pytest-xdist'
     )
+    failed_group = parser.add_mutually_exclusive_group()
+    failed_group.add_argument(
+        '--lf', '--last-failed', action='store_true',
+        help='Run only the tests that failed last time'
+    )
+    failed_group.add_argument(
+        '--ff', '--failed-first', action='store_true',
+        help='Run the tests that failed last time first, then the rest'
+    )
+    parser.add_argument(
+        '--no-result-cache', action='store_true',
+        help='Run the tests even if the same selection already passed on unchanged sources'
+    )
     
     # Output arguments
     parser.add_argument(
@@ -5,10 +5,32 @@ Simple pytest test runner for REGON MCP Server.
 This script runs the working pytest tests and provides a summary.
 """
 
+import importlib.util
+import os
 import subprocess
 import sys
 from pathlib import Path
 
+# Plugin autoloading is disabled for speed; pytest.ini needs these two
+PYTEST_PLUGIN_ARGS = ["-p", "pytest_asyncio.plugin", "-p", "pytest_cov.plugin", "--import-mode=importlib"]
+PYTEST_ENV = {**os.environ, "PYTEST_DISABLE_PLUGIN_AUTOLOAD": "1"}
+
+
+def parallel_args():
+    """
+    pytest-xdist arguments for this machine.
+    
+    Each test file stays on one worker (--dist loadfile) so fixtures shared
+    within a file are set up once.
+    
+    Returns:
+        Extra pytest arguments, empty when xdist is missing or there is one core
+    """
+    workers = min(os.cpu_count() or 1, 8)
+    if workers < 2 or importlib.util.find_spec("xdist") is None:
+        return []
+    return ["-p", "xdist.plugin", "-n", str(workers), "--dist", "loadfile"]
+
 
 def run_working_tests():
     """Run only the tests that are known to work."""
@@ -20,7 +42,7 @@ def run_working_tests():
     
     # Run specific working tests
     cmd = [
-        sys.executable, "-m", "pytest",
+        sys.executable, "-m", "pytest", *PYTEST_PLUGIN_ARGS, *parallel_args(),
         "tests/test_error_handling_simple.py",
         "-v",
         "--cov=regon_mcp_server",
@@ -29,7 +51,7 @@ def run_working_tests():
     ]
     
     try:
-        result = subprocess.run(cmd, cwd=project_root, capture_output=False)
+        result = subprocess.run(cmd, cwd=project_root, env=PYTEST_ENV, capture_output=False)
         
         if result.returncode == 0:
             print("\n✅ All working tests passed!")
@@ -59,7 +81,7 @@ def run_all_tests():
     
     # Run all tests
     cmd = [
-        sys.executable, "-m", "pytest",
+        sys.executable, "-m", "pytest", *PYTEST_PLUGIN_ARGS, *parallel_args(),
         "tests/",
         "-v",
         "--cov=regon_mcp_server",
@@ -69,7 +91,7 @@ def run_all_tests():
     ]
     
     try:
-        result = subprocess.run(cmd, cwd=project_root, capture_output=False)
+        result = subprocess.run(cmd, cwd=project_root, env=PYTEST_ENV, capture_output=False)
         return result.returncode
         
     except Exception as e:
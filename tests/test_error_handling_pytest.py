@@ -8,7 +8,7 @@ functionality, including retry mechanisms, input validation, and sanitization.
 import asyncio
 import sys
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -27,27 +27,30 @@ from regon_mcp_server.error_handling import (
     ConfigurationError
 )
 
+# One well-formed identifier per validate_input kind
+VALID_IDENTIFIERS = [
+    ("nip", "1234567890"),
+    ("regon9", "123456789"),
+    ("regon14", "12345678901234"),
+    ("regon", "123456789"),
+    ("regon", "12345678901234"),
+    ("krs", "0000012345"),
+]
+
 
 class TestRetryMechanism:
     """Test suite for the RetryMechanism class."""
     
     @pytest.mark.unit
-    def test_retry_mechanism_initialization(self):
-        """Test RetryMechanism initialization with default parameters."""
-        retry = RetryMechanism()
-        
-        assert retry.max_retries == 3
-        assert retry.delay == 1.0
-        assert retry.backoff_factor == 2.0
-    
-    @pytest.mark.unit
-    def test_retry_mechanism_custom_parameters(self):
-        """Test RetryMechanism initialization with custom parameters."""
-        retry = RetryMechanism(max_retries=5, delay=2.0, backoff_factor=1.5)
+    @pytest.mark.parametrize("kwargs,expected", [
+        ({}, (3, 1.0, 2.0)),
+        ({"max_retries": 5, "delay": 2.0, "backoff_factor": 1.5}, (5, 2.0, 1.5)),
+    ], ids=["defaults", "custom"])
+    def test_retry_mechanism_parameters(self, kwargs, expected):
+        """Test RetryMechanism initialization with default and custom parameters."""
+        retry = RetryMechanism(**kwargs)
         
-        assert retry.max_retries == 5
-        assert retry.delay == 2.0
-        assert retry.backoff_factor == 1.5
+        assert (retry.max_retries, retry.delay, retry.backoff_factor) == expected
     
     @pytest.mark.unit
     @pytest.mark.asyncio
@@ -98,20 +101,17 @@ class TestRetryMechanism:
         """Test that retry delays follow backoff factor."""
         retry = RetryMechanism(max_retries=3, delay=0.1, backoff_factor=2.0)
         
-        delays = []
-        
-        with patch('asyncio.sleep') as mock_sleep:
-            mock_sleep.side_effect = lambda delay: delays.append(delay)
-            
+        with patch('asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
             async def failing_operation():
                 raise Exception("Always fails")
             
-            with pytest.raises(Exception):
-                await retry.async_retry(failing_operation)
+            with pytest.raises(Exception, match="Always fails"):
+                await retry.async_retry(failing_operation)()
             
             # Check that delays follow backoff pattern
+            delays = [call.args[0] for call in mock_sleep.call_args_list]
             expected_delays = [0.1, 0.2, 0.4]
-            assert delays == expected_delays
+            assert delays == pytest.approx(expected_delays)
     
     @pytest.mark.unit
     @pytest.mark.asyncio
@@ -193,6 +193,25 @@ class TestInputValidation:
         """Test validation of non-numeric inputs."""
         with pytest.raises(ValidationError):
             validate_input("12345678ab", 'nip')
+    
+    @pytest.mark.unit
+    @pytest.mark.parametrize("kind,value", VALID_IDENTIFIERS)
+    def test_validate_input_identifier_kinds(self, kind, value):
+        """Test that a well-formed identifier of every kind is accepted."""
+        assert validate_input(value, kind) == value
+    
+    @pytest.mark.unit
+    @pytest.mark.parametrize("kind,value", VALID_IDENTIFIERS)
+    @pytest.mark.parametrize("mangle", [
+        lambda value: value + "0",
+        lambda value: value[:-1],
+        lambda value: value[:-1] + "a",
+        lambda value: value + "\n",
+    ], ids=["too_long", "too_short", "non_digit", "trailing_newline"])
+    def test_validate_input_rejects_malformed_identifiers(self, kind, value, mangle):
+        """Test that identifiers of the wrong length, with non-digits or a trailing newline are rejected."""
+        with pytest.raises(ValidationError):
+            validate_input(mangle(value), kind)
 
 
 class TestStringSanitization:
@@ -254,42 +273,22 @@ class TestCustomExceptions:
     
     @pytest.mark.unit
     def test_server_error_creation(self):
-        """Test ServerError exception creation."""
-        error = ServerError("Test error message")
+        """Test ServerError exception creation and properties."""
+        error = ServerError("Test error message", "TEST_CODE", {"key": "value"})
         assert str(error) == "Test error message"
         assert isinstance(error, Exception)
+        assert error.error_code == "TEST_CODE"
+        assert error.details == {"key": "value"}
     
     @pytest.mark.unit
-    def test_validation_error_creation(self):
-        """Test ValidationError exception creation."""
-        error = ValidationError("Invalid input")
-        assert str(error) == "Invalid input"
-        assert isinstance(error, ServerError)
-    
-    @pytest.mark.unit
-    def test_api_error_creation(self):
-        """Test APIError exception creation."""
-        error = APIError("API call failed")
-        assert str(error) == "API call failed"
-        assert isinstance(error, ServerError)
-    
-    @pytest.mark.unit
-    def test_network_error_creation(self):
-        """Test NetworkError exception creation."""
-        error = NetworkError("Network operation failed")
-        assert str(error) == "Network operation failed"
+    @pytest.mark.parametrize("error_class", [
+        ValidationError, APIError, NetworkError, ConfigurationError
+    ])
+    def test_error_subclass_creation(self, error_class):
+        """Test that each custom exception keeps its message and derives from ServerError."""
+        error = error_class("Operation failed")
+        assert str(error) == "Operation failed"
         assert isinstance(error, ServerError)
-    
-    @pytest.mark.unit
-    def test_exception_hierarchy(self):
-        """Test that all custom exceptions inherit from ServerError."""
-        validation_error = ValidationError("test")
-        api_error = APIError("test")
-        network_error = NetworkError("test")
-        
-        assert isinstance(validation_error, ServerError)
-        assert isinstance(api_error, ServerError)
-        assert isinstance(network_error, ServerError)
 
 
 class TestErrorHandlingIntegration:
@@ -3,36 +3,23 @@ Simple error handling tests with correct API usage.
 """
 
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 from regon_mcp_server.error_handling import (
     RetryMechanism, 
-    ServerError, 
     ValidationError, 
-    APIError,
-    NetworkError,
-    ConfigurationError,
     validate_input,
-    sanitize_string
+    make_validator,
+    sanitize_string,
+    safe_json_parse,
+    traceback_due,
+    tool_error_handler,
+    format_json
 )
 
 
 class TestRetryMechanism:
     """Test the RetryMechanism class with correct API usage."""
     
-    def test_retry_mechanism_initialization(self):
-        """Test RetryMechanism initialization."""
-        retry = RetryMechanism()
-        assert retry.max_retries == 3
-        assert retry.delay == 1.0
-        assert retry.backoff_factor == 2.0
-    
-    def test_retry_mechanism_custom_params(self):
-        """Test RetryMechanism with custom parameters."""
-        retry = RetryMechanism(max_retries=5, delay=2.0, backoff_factor=1.5)
-        assert retry.max_retries == 5
-        assert retry.delay == 2.0
-        assert retry.backoff_factor == 1.5
-    
     @pytest.mark.asyncio
     async def test_async_retry_as_decorator_success(self):
         """Test async_retry used as a decorator with successful operation."""
@@ -90,6 +77,19 @@ class TestValidation:
         
         with pytest.raises(ValidationError, match="Input must be a dictionary"):
             validate_input(data, required_fields)
+    
+    def test_make_validator_matches_validate_input(self):
+        """Test that a specialized validator enforces the same schema."""
+        validator = make_validator(["regon", "report_name"], {"regon": str, "report_name": str})
+        data = {"regon": "123456789", "report_name": "BIR11OsPrawna"}
+        
+        assert validator(data) == data
+        with pytest.raises(ValidationError, match="Missing required fields"):
+            validator({"regon": "123456789"})
+        with pytest.raises(ValidationError, match="must be of type str"):
+            validator({"regon": 123456789, "report_name": "BIR11OsPrawna"})
+        with pytest.raises(ValidationError, match="Input must be a dictionary"):
+            validator("not a dictionary")
 
 
 class TestSanitization:
@@ -115,36 +115,61 @@ class TestSanitization:
         assert isinstance(result, str)
 
 
-class TestCustomExceptions:
-    """Test custom exception classes."""
+class TestJsonParsing:
+    """Test safe JSON parsing."""
     
-    def test_server_error_creation(self):
-        """Test ServerError creation and properties."""
-        error = ServerError("Test error", "TEST_CODE", {"key": "value"})
-        assert str(error) == "Test error"
-        assert error.error_code == "TEST_CODE"
-        assert error.details == {"key": "value"}
+    def test_safe_json_parse_str_and_bytes(self):
+        """Test parsing of both str and bytes payloads."""
+        payload = '{"nip": "1234567890", "nazwa": "Spółka"}'
+        expected = {"nip": "1234567890", "nazwa": "Spółka"}
+        assert safe_json_parse(payload) == expected
+        assert safe_json_parse(payload.encode('utf-8')) == expected
     
-    def test_validation_error_creation(self):
-        """Test ValidationError creation."""
-        error = ValidationError("Invalid input")
-        assert str(error) == "Invalid input"
-        assert isinstance(error, ServerError)
+    def test_format_json_matches_stdlib_output(self):
+        """Test that format_json matches indented stdlib output with Polish text."""
+        import json
+        data = [{"Nazwa": "SPÓŁKA AKCYJNA", "Typ": "osoba prawna", "Pkd": [1, 2.5, None, True], "Extra": {}}]
+        assert format_json(data) == json.dumps(data, indent=2, ensure_ascii=False)
+    
+    def test_safe_json_parse_invalid_returns_default(self):
+        """Test that invalid JSON returns the default value."""
+        assert safe_json_parse("invalid json") is None
+        assert safe_json_parse("invalid json", default={}) == {}
+
+
+class TestToolErrorHandler:
+    """Test the tool handler error decorator."""
     
-    def test_api_error_creation(self):
-        """Test APIError creation."""
-        error = APIError("API failed")
-        assert str(error) == "API failed"
-        assert isinstance(error, ServerError)
+    @pytest.mark.asyncio
+    async def test_tool_error_handler_passes_result_through(self):
+        """Test that successful handler results are returned unchanged."""
+        @tool_error_handler("NIP search")
+        async def handler():
+            return ["ok"]
+        
+        assert await handler() == ["ok"]
     
-    def test_network_error_creation(self):
-        """Test NetworkError creation."""
-        error = NetworkError("Network failed")
-        assert str(error) == "Network failed"
-        assert isinstance(error, ServerError)
+    @pytest.mark.asyncio
+    async def test_tool_error_handler_converts_exceptions(self):
+        """Test that handler exceptions become an error response."""
+        @tool_error_handler("NIP search")
+        async def handler():
+            raise ValidationError("NIP must be exactly 10 digits")
+        
+        result = await handler()
+        assert len(result) == 1
+        assert result[0].text.startswith("NIP search\n")
+        assert "VALIDATION_ERROR: NIP must be exactly 10 digits" in result[0].text
+
+
+class TestTracebackRateLimit:
+    """Test traceback rate limiting for error logs."""
     
-    def test_configuration_error_creation(self):
-        """Test ConfigurationError creation."""
-        error = ConfigurationError("Config failed")
-        assert str(error) == "Config failed"
-        assert isinstance(error, ServerError)
+    def test_traceback_due_once_per_interval(self, monkeypatch):
+        """Test that tracebacks are allowed at most once per interval."""
+        monkeypatch.setattr("regon_mcp_server.error_handling._last_traceback_log", 0.0)
+        
+        with patch("regon_mcp_server.error_handling.time.monotonic", side_effect=[100.0, 101.0, 106.0]):
+            assert traceback_due(interval=5.0) is True
+            assert traceback_due(interval=5.0) is False
+            assert traceback_due(interval=5.0) is True
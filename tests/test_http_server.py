@@ -10,21 +10,34 @@ import asyncio
 import json
 import os
 import sys
+import traceback
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, Any
 
 # Configure UTF-8 encoding
-os.environ['PYTHONIOENCODING'] = 'utf-8'
-if sys.platform == "win32":
+if os.environ.get('PYTHONIOENCODING', '').lower() != 'utf-8':
+    os.environ['PYTHONIOENCODING'] = 'utf-8'
+if sys.platform == "win32" and (sys.stdout.encoding or "").lower().replace("-", "") != "utf8":
     sys.stdout.reconfigure(encoding='utf-8')
     sys.stderr.reconfigure(encoding='utf-8')
 
+# Polish text the test company's name and municipality must contain intact
+EXPECTED_NAZWA = "SPÓŁKA"
+EXPECTED_GMINA = "Północ"
+
 class HttpMcpClient:
     """Simple HTTP client for testing the HTTP MCP server."""
     
     def __init__(self, base_url: str = "http://localhost:8001"):
         self.base_url = base_url.rstrip('/')
         self.session = requests.Session()
+        # Pool sized for concurrent checks; connection failures are retried
+        # briefly before a check is reported as failed
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16,
+                              max_retries=Retry(total=2, backoff_factor=0.1))
+        self.session.mount("http://", adapter)
     
     def get_server_info(self) -> Dict[str, Any]:
         """Get server information."""
@@ -68,78 +81,107 @@ class HttpMcpClient:
 
 def test_http_server():
     """Test the HTTP MCP server functionality."""
-    print("🧪 Testing HTTP MCP Server")
-    print("=" * 50)
+    run_http_checks(HttpMcpClient())
+
+def run_http_checks(client: HttpMcpClient, verbose: bool = False):
+    """
+    Exercise the HTTP MCP server endpoints and print the results.
+    
+    The report is collected while the checks run and written to stdout
+    in a single call at the end.
     
-    client = HttpMcpClient()
+    Args:
+        client: Client pointed at the server under test
+        verbose: Include the traceback when a check fails
+    """
+    lines = ["🧪 Testing HTTP MCP Server", "=" * 50]
+    out = lines.append
     
     try:
         # Test 1: Server info
-        print("\n🔍 Test 1: Server Information")
+        out("\n🔍 Test 1: Server Information")
         info = client.get_server_info()
-        print(f"   Service: {info['service']}")
-        print(f"   Mode: {info['mode']}")
-        print(f"   Encoding: {info['encoding']}")
-        print(f"   Polish chars: {info['polish_characters']}")
+        out(f"   Service: {info['service']}")
+        out(f"   Mode: {info['mode']}")
+        out(f"   Encoding: {info['encoding']}")
+        out(f"   Polish chars: {info['polish_characters']}")
         
         # Test 2: Health check
-        print("\n🔍 Test 2: Health Check")
+        out("\n🔍 Test 2: Health Check")
         health = client.health_check()
-        print(f"   Status: {health['status']}")
-        print(f"   REGON Service: {health['regon_service']['status_message']}")
+        out(f"   Status: {health['status']}")
+        out(f"   REGON Service: {health['regon_service']['status_message']}")
         
         # Test 3: List tools
-        print("\n🔍 Test 3: Available Tools")
+        out("\n🔍 Test 3: Available Tools")
         tools = client.list_tools()
-        print(f"   Available tools: {len(tools['tools'])}")
+        out(f"   Available tools: {len(tools['tools'])}")
         for tool in tools['tools'][:3]:  # Show first 3
-            print(f"   - {tool['name']}: {tool['description']}")
+            out(f"   - {tool['name']}: {tool['description']}")
         
-        # Test 4: NIP search using tool call
-        print("\n🔍 Test 4: Tool Call - NIP Search")
+        # Test 4: NIP search using tool call; the encoding check scans the raw
+        # result text, which is only parsed to report what came back instead
+        out("\n🔍 Test 4: Tool Call - NIP Search")
         nip_result = client.call_tool("regon_search_by_nip", {"nip": "7342867148"})
-        result_data = json.loads(nip_result['result'][0]['text'])
-        if result_data and len(result_data) > 0:
-            company = result_data[0]
-            nazwa = company.get('Nazwa', '')
-            gmina = company.get('Gmina', '')
-            print(f"   Company: {nazwa}")
-            print(f"   Location: {gmina}")
-            
-            # Verify encoding
-            if "SPÓŁKA" in nazwa and "Północ" in gmina:
-                print(f"   ✅ Polish characters work correctly!")
-            else:
-                print(f"   ❌ Encoding issue detected")
+        result_text = nip_result['result'][0]['text']
+        if EXPECTED_NAZWA in result_text and EXPECTED_GMINA in result_text:
+            out("   ✅ Polish characters work correctly!")
+        else:
+            result_data = json.loads(result_text)
+            if result_data and len(result_data) > 0:
+                company = result_data[0]
+                out(f"   Company: {company.get('Nazwa', '')}")
+                out(f"   Location: {company.get('Gmina', '')}")
+            out("   ❌ Encoding issue detected")
         
         # Test 5: Convenience endpoint
-        print("\n🔍 Test 5: Convenience Endpoint - NIP Search")
+        out("\n🔍 Test 5: Convenience Endpoint - NIP Search")
         nip_conv = client.search_by_nip("7342867148")
         if nip_conv['result'] and len(nip_conv['result']) > 0:
             company = nip_conv['result'][0]
-            print(f"   Company: {company.get('Nazwa', '')}")
-            print(f"   Location: {company.get('Gmina', '')}")
+            out(f"   Company: {company.get('Nazwa', '')}")
+            out(f"   Location: {company.get('Gmina', '')}")
         
         # Test 6: KRS search
-        print("\n🔍 Test 6: KRS Search")
+        out("\n🔍 Test 6: KRS Search")
         krs_result = client.search_by_krs("0000006865")
         if krs_result['result'] and len(krs_result['result']) > 0:
             company = krs_result['result'][0]
-            print(f"   Company: {company.get('Nazwa', '')}")
-            print(f"   NIP: {company.get('Nip', '')}")
+            out(f"   Company: {company.get('Nazwa', '')}")
+            out(f"   NIP: {company.get('Nip', '')}")
         
-        print("\n🎉 All tests passed! HTTP server is working correctly.")
-        print("   The HTTP wrapper preserves all stdio server functionality.")
-        print("   Polish character encoding works perfectly.")
+        out("\n🎉 All tests passed! HTTP server is working correctly.")
+        out("   The HTTP wrapper preserves all stdio server functionality.")
+        out("   Polish character encoding works perfectly.")
         
     except requests.ConnectionError:
-        print("❌ Could not connect to HTTP server.")
-        print("   Make sure the server is running with:")
-        print("   python regon_mcp_server/server_http.py")
+        out("❌ Could not connect to HTTP server.")
+        out("   Make sure the server is running with:")
+        out("   python regon_mcp_server/server_http.py")
     except Exception as e:
-        print(f"❌ Test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        out(f"❌ Test failed: {e}")
+        if verbose:
+            out(traceback.format_exc().rstrip())
+    finally:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+def main(port: int = 8001, verbose: bool = False):
+    """
+    Run the HTTP checks against a server on localhost.
+    
+    Args:
+        port: Port the HTTP server listens on
+        verbose: Include the traceback when a check fails
+    """
+    run_http_checks(HttpMcpClient(f"http://localhost:{port}"), verbose)
 
 if __name__ == "__main__":
-    test_http_server()
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Test the REGON HTTP MCP server')
+    parser.add_argument('--port', '-p', type=int, default=8001,
+                        help='HTTP server port to test (default: 8001)')
+    parser.add_argument('--verbose', '-v', action='store_true',
+                        help='Show the traceback when a check fails')
+    args = parser.parse_args()
+    main(port=args.port, verbose=args.verbose)
@@ -11,12 +11,41 @@ import asyncio
 import json
 import sys
 import os
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+# orjson is optional; it encodes straight to bytes and parses bytes without
+# decoding them first
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def dumps_line(message):
+    """Encode a JSON-RPC message as one newline-terminated line of bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(message) + b"\n"
+    return json.dumps(message).encode() + b"\n"
+
+def loads(data):
+    """Decode JSON from str or bytes."""
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+# uvloop is optional; it speeds up the subprocess pipe I/O these tests spend
+# most of their time in (it does not support Windows)
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = sys.platform != "win32"
+except ImportError:
+    UVLOOP_AVAILABLE = False
 
 # Configure UTF-8 encoding for proper Unicode handling
-os.environ['PYTHONIOENCODING'] = 'utf-8'
+if os.environ.get('PYTHONIOENCODING', '').lower() != 'utf-8':
+    os.environ['PYTHONIOENCODING'] = 'utf-8'
 
-# Configure UTF-8 encoding for Windows console output
-if sys.platform == "win32":
+# Configure UTF-8 encoding for Windows console output, unless it already is
+if sys.platform == "win32" and (sys.stdout.encoding or "").lower().replace("-", "") != "utf8":
     try:
         sys.stdout.reconfigure(encoding='utf-8')
         sys.stderr.reconfigure(encoding='utf-8')
@@ -26,63 +55,150 @@ if sys.platform == "win32":
         sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer)
         sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer)
 
+# The server is started from the project root, wherever the test runs from
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Upper bound for a single JSON-RPC response; a hung server fails the test
+# instead of blocking it forever
+RESPONSE_TIMEOUT = 15.0
+
+# JSON-RPC messages of the test session
+INIT_REQUEST = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2024-11-05",
+        "capabilities": {
+            "roots": {
+                "listChanged": True
+            },
+            "sampling": {}
+        },
+        "clientInfo": {
+            "name": "test-client",
+            "version": "1.0.0"
+        }
+    }
+}
+
+LIST_TOOLS_REQUEST = {
+    "jsonrpc": "2.0",
+    "id": 2,
+    "method": "tools/list",
+    "params": {}
+}
+
+CALL_TOOL_REQUEST = {
+    "jsonrpc": "2.0",
+    "id": 3,
+    "method": "tools/call",
+    "params": {
+        "name": "regon_search_by_nip",
+        "arguments": {"nip": "7342867148"}
+    }
+}
+
+INVALID_TOOL_REQUEST = {
+    "jsonrpc": "2.0",
+    "id": 4,
+    "method": "tools/call",
+    "params": {
+        "name": "non_existent_tool",
+        "arguments": {}
+    }
+}
+
+INITIALIZED_NOTIFICATION = {
+    "jsonrpc": "2.0",
+    "method": "notifications/initialized"
+}
+
+# The whole test session, encoded once: the server handles the messages in
+# order and the responses are matched back by id
+SESSION_MESSAGES = (INIT_REQUEST, INITIALIZED_NOTIFICATION, LIST_TOOLS_REQUEST,
+                    CALL_TOOL_REQUEST, INVALID_TOOL_REQUEST)
+SESSION_PAYLOAD = b"".join(dumps_line(m) for m in SESSION_MESSAGES)
+SESSION_RESPONSES = sum(1 for m in SESSION_MESSAGES if "id" in m)
+
+@asynccontextmanager
+async def spawn_server(*args):
+    """
+    Start the stdio server and make sure it is gone when the block exits.
+    
+    Args:
+        *args: Extra command line arguments for server.py
+        
+    Yields:
+        The server process, with stdin and stdout piped
+    """
+    process = await asyncio.create_subprocess_exec(
+        sys.executable, "regon_mcp_server/server.py", *args,
+        cwd=PROJECT_ROOT,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=None,  # Server errors stream to the console; an unread pipe could fill up
+        limit=2 ** 20  # Responses are single lines; allow more than the default 64 KiB
+    )
+    try:
+        yield process
+    finally:
+        if process.returncode is None:
+            process.terminate()
+            try:
+                await asyncio.wait_for(process.wait(), 1.0)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+
+async def read_responses(process, count):
+    """
+    Read JSON-RPC responses from the server, keyed by request id.
+    
+    Args:
+        process: Running server process
+        count: Number of responses expected
+        
+    Returns:
+        Dictionary of responses by id; shorter if the server stopped early
+    """
+    responses = {}
+    while len(responses) < count:
+        try:
+            line = await asyncio.wait_for(process.stdout.readline(), RESPONSE_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"no response within {RESPONSE_TIMEOUT:.0f}s")
+        if not line:
+            break
+        message = loads(line)
+        if "id" in message:
+            responses[message["id"]] = message
+    return responses
+
 async def test_mcp_server():
     """Test the MCP server with manual JSON-RPC messages."""
     
     print("🚀 Testing MCP Protocol Compliance")
     print("=" * 50)
     
-    # Change to project root if we're in tests directory
-    original_dir = os.getcwd()
-    if 'tests' in os.getcwd():
-        os.chdir('..')
-    
     try:
-        # Start the server
+        # Start the server; it is always stopped when the block exits
         print("\n📋 Starting MCP server...")
-        process = await asyncio.create_subprocess_exec(
-            sys.executable, "regon_mcp_server/server.py", "--log-level", "ERROR",
-            stdin=asyncio.subprocess.PIPE,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
-        
-        async def send_message(message):
-            """Send a JSON-RPC message to the server."""
-            json_message = json.dumps(message) + '\n'
-            process.stdin.write(json_message.encode())
-            await process.stdin.drain()
-        
-        async def read_response():
-            """Read a JSON-RPC response from the server."""
-            line = await process.stdout.readline()
-            if line:
-                return json.loads(line.decode().strip())
-            return None
+        async with spawn_server("--log-level", "ERROR") as process:
+            process.stdin.write(SESSION_PAYLOAD)
+            await asyncio.wait_for(process.stdin.drain(), RESPONSE_TIMEOUT)
+            responses = await read_responses(process, SESSION_RESPONSES)
+            
+            # Closing stdin lets the server shut down on its own
+            process.stdin.close()
+            try:
+                await asyncio.wait_for(process.wait(), RESPONSE_TIMEOUT)
+            except asyncio.TimeoutError:
+                pass
         
         # Test 1: Initialize
         print("\n✅ Test 1: Server Initialization")
-        init_message = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "initialize",
-            "params": {
-                "protocolVersion": "2024-11-05",
-                "capabilities": {
-                    "roots": {
-                        "listChanged": True
-                    },
-                    "sampling": {}
-                },
-                "clientInfo": {
-                    "name": "test-client",
-                    "version": "1.0.0"
-                }
-            }
-        }
-        
-        await send_message(init_message)
-        response = await read_response()
+        response = responses.get(INIT_REQUEST["id"])
         
         if response and response.get("result"):
             print("   ✅ Server initialized successfully")
@@ -95,15 +211,7 @@ async def test_mcp_server():
         
         # Test 2: List tools
         print("\n✅ Test 2: List Available Tools")
-        list_tools_message = {
-            "jsonrpc": "2.0",
-            "id": 2,
-            "method": "tools/list",
-            "params": {}
-        }
-        
-        await send_message(list_tools_message)
-        response = await read_response()
+        response = responses.get(LIST_TOOLS_REQUEST["id"])
         
         if response and response.get("result") and "tools" in response["result"]:
             tools = response["result"]["tools"]
@@ -117,23 +225,12 @@ async def test_mcp_server():
         
         # Test 3: Call a tool
         print("\n✅ Test 3: Call MCP Tool")
-        call_tool_message = {
-            "jsonrpc": "2.0",
-            "id": 3,
-            "method": "tools/call",
-            "params": {
-                "name": "regon_search_by_nip",
-                "arguments": {"nip": "7342867148"}
-            }
-        }
-        
-        await send_message(call_tool_message)
-        response = await read_response()
+        response = responses.get(CALL_TOOL_REQUEST["id"])
         
         if response and response.get("result"):
             content = response["result"].get("content", [])
             if content and content[0].get("text"):
-                result_data = json.loads(content[0]["text"])
+                result_data = loads(content[0]["text"])
                 if isinstance(result_data, list) and len(result_data) > 0:
                     company = result_data[0]
                     print("   ✅ Tool call successful")
@@ -156,18 +253,7 @@ async def test_mcp_server():
         
         # Test 4: Invalid tool call
         print("\n✅ Test 4: Error Handling (Invalid Tool)")
-        invalid_tool_message = {
-            "jsonrpc": "2.0",
-            "id": 4,
-            "method": "tools/call",
-            "params": {
-                "name": "non_existent_tool",
-                "arguments": {}
-            }
-        }
-        
-        await send_message(invalid_tool_message)
-        response = await read_response()
+        response = responses.get(INVALID_TOOL_REQUEST["id"])
         
         if response and response.get("error"):
             print("   ✅ Error handling works correctly")
@@ -175,11 +261,6 @@ async def test_mcp_server():
         else:
             print(f"   ❌ Expected error response, got: {response}")
         
-        # Cleanup
-        print("\n🧹 Cleaning up...")
-        process.stdin.close()
-        await process.wait()
-        
         print("\n🎉 MCP Protocol Test Completed!")
         print("\n📋 Summary:")
         print("   ✅ JSON-RPC 2.0 protocol compliance")
@@ -191,16 +272,12 @@ async def test_mcp_server():
         
     except Exception as e:
         print(f"\n❌ Test failed: {e}")
-        if 'process' in locals():
-            process.terminate()
-            await process.wait()
-    finally:
-        # Restore original directory
-        os.chdir(original_dir)
 
 def main():
     """Main entry point."""
     try:
+        if UVLOOP_AVAILABLE:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
         asyncio.run(test_mcp_server())
     except KeyboardInterrupt:
         print("\n🛑 Test interrupted by user")
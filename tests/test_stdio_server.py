@@ -12,12 +12,22 @@ import sys
 import json
 import asyncio
 import os
+from pathlib import Path
+
+# uvloop is optional; it speeds up the subprocess pipe I/O these tests spend
+# most of their time in (it does not support Windows)
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = sys.platform != "win32"
+except ImportError:
+    UVLOOP_AVAILABLE = False
 
 # Configure UTF-8 encoding for proper Unicode handling
-os.environ['PYTHONIOENCODING'] = 'utf-8'
+if os.environ.get('PYTHONIOENCODING', '').lower() != 'utf-8':
+    os.environ['PYTHONIOENCODING'] = 'utf-8'
 
-# Configure UTF-8 encoding for Windows console output
-if sys.platform == "win32":
+# Configure UTF-8 encoding for Windows console output, unless it already is
+if sys.platform == "win32" and (sys.stdout.encoding or "").lower().replace("-", "") != "utf8":
     try:
         sys.stdout.reconfigure(encoding='utf-8')
         sys.stderr.reconfigure(encoding='utf-8')
@@ -27,133 +37,182 @@ if sys.platform == "win32":
         sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer)
         sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer)
 
+# The server is started from the project root, wherever the test runs from
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+async def run_server(args, input_text, timeout, capture_stdout=True):
+    """
+    Run the stdio server with the given input without blocking the event loop.
+    
+    Args:
+        args: Extra command line arguments for server.py
+        input_text: Text written to the server's stdin
+        timeout: Seconds to wait before the server is killed
+        capture_stdout: Keep the server's output; when False it is discarded
+        
+    Returns:
+        CompletedProcess with decoded stdout ('' when discarded); stderr is left as bytes
+        
+    Raises:
+        subprocess.TimeoutExpired: If the server did not finish in time
+    """
+    cmd = [sys.executable, "regon_mcp_server/server.py", *args]
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        cwd=PROJECT_ROOT,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE if capture_stdout else asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(
+            process.communicate(input_text.encode('utf-8')), timeout
+        )
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    return subprocess.CompletedProcess(cmd, process.returncode,
+                                       stdout.decode('utf-8') if stdout else '', stderr)
+
+def find_response(stdout, request_id):
+    """
+    Find the JSON-RPC response to a request in the server's output.
+    
+    Lines that cannot be a response (log output, notifications) are skipped
+    without being parsed.
+    
+    Args:
+        stdout: Decoded server output, one JSON message per line
+        request_id: Id of the request whose response is wanted
+        
+    Returns:
+        The response message, or None if the server did not answer
+    """
+    for line in stdout.splitlines():
+        line = line.strip()
+        if not line.startswith('{') or '"id"' not in line:
+            continue
+        try:
+            response = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if response.get("id") == request_id:
+            return response
+    return None
+
 async def test_server_functionality():
     """Test basic server functionality with a simple tool call."""
     print("🚀 Testing Stdio MCP Server")
     print("=" * 50)
     
-    # Change to project root if we're in tests directory
-    original_dir = os.getcwd()
-    if 'tests' in os.getcwd():
-        os.chdir('..')
+    tools_list = {"jsonrpc": "2.0", "id": 1, "method": "tools/list"}
+    tool_call = {
+        "jsonrpc": "2.0",
+        "id": 2,
+        "method": "tools/call",
+        "params": {
+            "name": "regon_search_by_nip",
+            "arguments": {"nip": "7342867148"}
+        }
+    }
+    
+    # One test-mode server answers both the tool listing and the tool call;
+    # the production-mode run is independent, so the two start together and
+    # the results are reported in order below
+    mode_result, production_result = await asyncio.gather(
+        run_server(["--log-level", "WARNING"],
+                   json.dumps(tools_list) + '\n' + json.dumps(tool_call) + '\n', timeout=15),
+        run_server(["--production", "--log-level", "ERROR"],
+                   json.dumps(tools_list) + '\n', timeout=10, capture_stdout=False),
+        return_exceptions=True
+    )
     
+    # Test 1: Test mode (default)
+    print("\n📋 Test 1: Default test mode")
     try:
-        # Test 1: Test mode (default)
-        print("\n📋 Test 1: Default test mode")
-        try:
-            result = subprocess.run([
-                sys.executable, "regon_mcp_server/server.py", "--log-level", "WARNING"
-            ], input='{"jsonrpc": "2.0", "id": 1, "method": "tools/list"}\n', 
-               text=True, capture_output=True, timeout=10)
+        result = mode_result
+        if isinstance(result, Exception):
+            raise result
+        
+        if result.returncode == 0:
+            response = find_response(result.stdout, tools_list["id"])
+            if response and response.get("result") and "tools" in response["result"]:
+                tools = response["result"]["tools"]
+                print(f"   ✅ Found {len(tools)} tools")
+                print(f"   📋 Available tools: {', '.join([t['name'] for t in tools[:3]])}...")
+        else:
+            print(f"   ❌ Server failed with return code: {result.returncode}")
+            print(f"   Error: {result.stderr.decode('utf-8', 'replace')}")
             
-            if result.returncode == 0:
-                # Parse JSON-RPC response
-                lines = result.stdout.strip().split('\n')
-                for line in lines:
-                    if line.strip():
-                        try:
-                            response = json.loads(line)
-                            if response.get("result") and "tools" in response["result"]:
-                                tools = response["result"]["tools"]
-                                print(f"   ✅ Found {len(tools)} tools")
-                                print(f"   📋 Available tools: {', '.join([t['name'] for t in tools[:3]])}...")
-                                break
-                        except json.JSONDecodeError:
-                            continue
-            else:
-                print(f"   ❌ Server failed with return code: {result.returncode}")
-                print(f"   Error: {result.stderr}")
-                
-        except subprocess.TimeoutExpired:
-            print("   ❌ Server test timed out")
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
+    except subprocess.TimeoutExpired:
+        print("   ❌ Server test timed out")
+    except Exception as e:
+        print(f"   ❌ Error: {e}")
 
-        # Test 2: Production mode flag
-        print("\n📋 Test 2: Production mode startup test")
-        try:
-            result = subprocess.run([
-                sys.executable, "regon_mcp_server/server.py", "--production", "--log-level", "ERROR"
-            ], input='{"jsonrpc": "2.0", "id": 1, "method": "tools/list"}\n', 
-               text=True, capture_output=True, timeout=10)
+    # Test 2: Production mode flag
+    print("\n📋 Test 2: Production mode startup test")
+    try:
+        result = production_result
+        if isinstance(result, Exception):
+            raise result
+        
+        if result.returncode == 0:
+            print("   ✅ Production mode server starts successfully")
+        else:
+            print(f"   ⚠️  Production mode failed (may need API_KEY): {result.stderr.decode('utf-8', 'replace')[:100]}")
             
-            if result.returncode == 0:
-                print("   ✅ Production mode server starts successfully")
-            else:
-                print(f"   ⚠️  Production mode failed (may need API_KEY): {result.stderr[:100]}")
-                
-        except subprocess.TimeoutExpired:
-            print("   ❌ Production mode test timed out")
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
+    except subprocess.TimeoutExpired:
+        print("   ❌ Production mode test timed out")
+    except Exception as e:
+        print(f"   ❌ Error: {e}")
 
-        # Test 3: Tool call test
-        print("\n📋 Test 3: Tool call functionality")
-        try:
-            tool_call = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "tools/call",
-                "params": {
-                    "name": "regon_search_by_nip",
-                    "arguments": {"nip": "7342867148"}
-                }
-            }
-            
-            result = subprocess.run([
-                sys.executable, "regon_mcp_server/server.py", "--log-level", "ERROR"
-            ], input=json.dumps(tool_call) + '\n', 
-               text=True, capture_output=True, timeout=15)
+    # Test 3: Tool call test
+    print("\n📋 Test 3: Tool call functionality")
+    try:
+        result = mode_result
+        if isinstance(result, Exception):
+            raise result
+        
+        if result.returncode == 0:
+            response = find_response(result.stdout, tool_call["id"])
+            if response and response.get("result") and "content" in response["result"]:
+                content = response["result"]["content"]
+                if content and content[0].get("text"):
+                    result_data = json.loads(content[0]["text"])
+                    if isinstance(result_data, list) and len(result_data) > 0:
+                        company = result_data[0]
+                        print(f"   ✅ Tool call successful")
+                        print(f"   🏢 Company: {company.get('Nazwa', 'Unknown')}")
+                        print(f"   🆔 NIP: {company.get('Nip', 'Unknown')}")
+                        
+                        # Test Polish character encoding
+                        company_name = company.get('Nazwa', '')
+                        if any(char in company_name for char in 'ąćęłńóśźżĄĆĘŁŃÓŚŹŻ'):
+                            print(f"   ✅ Polish characters properly encoded")
+                        else:
+                            print(f"   ℹ️  No Polish characters in this company name")
+            elif response and response.get("error"):
+                print(f"   ❌ Tool call error: {response['error']}")
+        else:
+            print(f"   ❌ Tool call failed: {result.stderr.decode('utf-8', 'replace')}")
             
-            if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')
-                for line in lines:
-                    if line.strip():
-                        try:
-                            response = json.loads(line)
-                            if response.get("result") and "content" in response["result"]:
-                                content = response["result"]["content"]
-                                if content and content[0].get("text"):
-                                    result_data = json.loads(content[0]["text"])
-                                    if isinstance(result_data, list) and len(result_data) > 0:
-                                        company = result_data[0]
-                                        print(f"   ✅ Tool call successful")
-                                        print(f"   🏢 Company: {company.get('Nazwa', 'Unknown')}")
-                                        print(f"   🆔 NIP: {company.get('Nip', 'Unknown')}")
-                                        
-                                        # Test Polish character encoding
-                                        company_name = company.get('Nazwa', '')
-                                        if any(char in company_name for char in 'ąćęłńóśźżĄĆĘŁŃÓŚŹŻ'):
-                                            print(f"   ✅ Polish characters properly encoded")
-                                        else:
-                                            print(f"   ℹ️  No Polish characters in this company name")
-                                        break
-                            elif response.get("error"):
-                                print(f"   ❌ Tool call error: {response['error']}")
-                                break
-                        except json.JSONDecodeError:
-                            continue
-            else:
-                print(f"   ❌ Tool call failed: {result.stderr}")
-                
-        except subprocess.TimeoutExpired:
-            print("   ❌ Tool call test timed out")
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
+    except subprocess.TimeoutExpired:
+        print("   ❌ Tool call test timed out")
+    except Exception as e:
+        print(f"   ❌ Error: {e}")
 
-        print("\n🎉 Stdio MCP Server test completed!")
-        print("\n📋 Summary:")
-        print("   - Test mode: Server startup and tool listing")
-        print("   - Production mode: Startup test (may require API_KEY)")
-        print("   - Tool functionality: NIP search with encoding test")
-        
-    finally:
-        # Restore original directory
-        os.chdir(original_dir)
+    print("\n🎉 Stdio MCP Server test completed!")
+    print("\n📋 Summary:")
+    print("   - Test mode: Server startup and tool listing")
+    print("   - Production mode: Startup test (may require API_KEY)")
+    print("   - Tool functionality: NIP search with encoding test")
 
 def main():
     """Main entry point."""
     try:
+        if UVLOOP_AVAILABLE:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
         asyncio.run(test_server_functionality())
     except KeyboardInterrupt:
         print("\n🛑 Test interrupted by user")
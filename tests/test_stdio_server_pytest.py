@@ -19,6 +19,69 @@ import pytest
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+# Requests answered by the shared server session, by JSON-RPC id
+TOOLS_LIST_REQUEST = {"jsonrpc": "2.0", "id": 1, "method": "tools/list"}
+TOOL_CALL_REQUEST = {
+    "jsonrpc": "2.0",
+    "id": 2,
+    "method": "tools/call",
+    "params": {
+        "name": "regon_search_by_nip",
+        "arguments": {"nip": "7342867148"}
+    }
+}
+
+
+@pytest.fixture(scope="module")
+def stdio_session():
+    """
+    Run one server process for all the protocol requests of this module.
+    
+    Starting the server costs far more than answering a request, so the
+    requests are sent to a single process and each test reads its response.
+    
+    Returns:
+        Tuple of the completed server process and its responses by request id
+    """
+    payload = "".join(json.dumps(r) + "\n" for r in (TOOLS_LIST_REQUEST, TOOL_CALL_REQUEST))
+    
+    try:
+        result = subprocess.run([
+            sys.executable, "regon_mcp_server/server.py", "--log-level", "WARNING"
+        ], input=payload, text=True, capture_output=True, timeout=30, cwd=project_root)
+    except subprocess.TimeoutExpired:
+        pytest.fail("Stdio server session timed out")
+    
+    responses = {}
+    for line in result.stdout.splitlines():
+        if not line.startswith("{"):
+            continue
+        try:
+            response = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if "id" in response:
+            responses[response["id"]] = response
+    
+    return result, responses
+
+
+@pytest.fixture(scope="module")
+def help_result():
+    """
+    Run server.py --help once for the tests that check the command line.
+    
+    Returns:
+        Completed process of the help command
+    """
+    try:
+        return subprocess.run(
+            [sys.executable, "regon_mcp_server/server.py", "--help"],
+            capture_output=True, text=True, timeout=10, cwd=project_root
+        )
+    except subprocess.TimeoutExpired:
+        pytest.fail("Server help command timed out")
+
 
 class TestStdioMCPServer:
     """Test suite for the stdio MCP server."""
@@ -33,169 +96,110 @@ class TestStdioMCPServer:
         except ImportError as e:
             pytest.fail(f"Failed to import server module: {e}")
     
+    @pytest.mark.stdio
+    @pytest.mark.unit
+    def test_mcp_json_server_entries(self, mcp_config, project_root_path):
+        """Test that every server in mcp.json points at an existing script."""
+        servers = mcp_config["mcpServers"]
+        assert servers, "No servers configured in mcp.json"
+        
+        for name, server in servers.items():
+            script = project_root_path / server["args"][0]
+            assert script.is_file(), f"{name}: script not found: {script}"
+    
     @pytest.mark.stdio
     @pytest.mark.integration
-    def test_server_startup(self):
+    def test_server_startup(self, help_result):
         """Test that the server starts up without errors."""
-        # Change to project root for subprocess
-        original_dir = os.getcwd()
-        if 'tests' in os.getcwd():
-            os.chdir('..')
-        
-        try:
-            result = subprocess.run([
-                sys.executable, "regon_mcp_server/server.py", "--help"
-            ], capture_output=True, text=True, timeout=10)
-            
-            assert result.returncode == 0
-            assert "REGON MCP Server" in result.stdout or "usage:" in result.stdout
-        except subprocess.TimeoutExpired:
-            pytest.fail("Server help command timed out")
-        finally:
-            os.chdir(original_dir)
+        assert help_result.returncode == 0
+        assert "REGON MCP Server" in help_result.stdout or "usage:" in help_result.stdout
     
     @pytest.mark.stdio
     @pytest.mark.integration
-    def test_tools_list_functionality(self):
+    def test_tools_list_functionality(self, stdio_session):
         """Test the tools/list MCP method."""
-        original_dir = os.getcwd()
-        if 'tests' in os.getcwd():
-            os.chdir('..')
+        result, responses = stdio_session
         
-        try:
-            result = subprocess.run([
-                sys.executable, "regon_mcp_server/server.py", "--log-level", "WARNING"
-            ], input='{"jsonrpc": "2.0", "id": 1, "method": "tools/list"}\n', 
-               text=True, capture_output=True, timeout=15)
-            
-            assert result.returncode == 0
-            
-            # Parse JSON-RPC response
-            lines = result.stdout.strip().split('\n')
-            response_found = False
-            
-            for line in lines:
-                if line.strip():
-                    try:
-                        response = json.loads(line)
-                        if response.get("result") and "tools" in response["result"]:
-                            tools = response["result"]["tools"]
-                            assert len(tools) > 0, "No tools found in response"
-                            
-                            # Check for expected tools
-                            tool_names = [t['name'] for t in tools]
-                            expected_tools = [
-                                'regon_search_by_nip',
-                                'regon_search_by_regon',
-                                'regon_search_by_krs'
-                            ]
-                            
-                            for expected_tool in expected_tools:
-                                assert expected_tool in tool_names, f"Missing tool: {expected_tool}"
-                            
-                            response_found = True
-                            break
-                    except json.JSONDecodeError:
-                        continue
-            
-            assert response_found, "No valid JSON-RPC response found"
-            
-        except subprocess.TimeoutExpired:
-            pytest.fail("Tools list test timed out")
-        finally:
-            os.chdir(original_dir)
+        assert result.returncode == 0
+        
+        # Find the tools/list response
+        response = responses.get(TOOLS_LIST_REQUEST["id"])
+        assert response and "tools" in response.get("result", {}), "No valid JSON-RPC response found"
+        
+        tools = response["result"]["tools"]
+        assert len(tools) > 0, "No tools found in response"
+        
+        # Check for expected tools
+        tool_names = [t['name'] for t in tools]
+        expected_tools = [
+            'regon_search_by_nip',
+            'regon_search_by_regon',
+            'regon_search_by_krs'
+        ]
+        
+        for expected_tool in expected_tools:
+            assert expected_tool in tool_names, f"Missing tool: {expected_tool}"
     
     @pytest.mark.stdio
     @pytest.mark.integration
     @pytest.mark.slow
-    def test_tool_call_functionality(self):
+    def test_tool_call_functionality(self, stdio_session):
         """Test calling a tool through the MCP protocol."""
-        original_dir = os.getcwd()
-        if 'tests' in os.getcwd():
-            os.chdir('..')
+        result, responses = stdio_session
         
-        try:
-            tool_call = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "tools/call",
-                "params": {
-                    "name": "regon_search_by_nip",
-                    "arguments": {"nip": "7342867148"}
-                }
-            }
-            
-            result = subprocess.run([
-                sys.executable, "regon_mcp_server/server.py", "--log-level", "WARNING"
-            ], input=json.dumps(tool_call) + '\n', 
-               text=True, capture_output=True, timeout=30)
-            
-            # Allow both success (0) and API-related failures (1)
-            # since we might not have a valid API key in test environment
-            assert result.returncode in [0, 1]
-            
-            if result.returncode == 0:
-                # Parse successful response
-                lines = result.stdout.strip().split('\n')
-                for line in lines:
-                    if line.strip():
-                        try:
-                            response = json.loads(line)
-                            if "result" in response:
-                                assert "content" in response["result"]
-                                break
-                        except json.JSONDecodeError:
-                            continue
-            else:
-                # Check that error is API-related, not a code error
-                assert "API" in result.stderr or "authentication" in result.stderr.lower()
-                
-        except subprocess.TimeoutExpired:
-            pytest.fail("Tool call test timed out")
-        finally:
-            os.chdir(original_dir)
+        # Allow both success (0) and API-related failures (1)
+        # since we might not have a valid API key in test environment
+        assert result.returncode in [0, 1]
+        
+        if result.returncode == 0:
+            # Check the successful response
+            response = responses.get(TOOL_CALL_REQUEST["id"])
+            if response and "result" in response:
+                assert "content" in response["result"]
+        else:
+            # Check that error is API-related, not a code error
+            assert "API" in result.stderr or "authentication" in result.stderr.lower()
     
     @pytest.mark.stdio
     @pytest.mark.unit
-    def test_production_mode_flag(self):
+    def test_production_mode_flag(self, capsys):
         """Test that production mode flag is recognized."""
-        original_dir = os.getcwd()
-        if 'tests' in os.getcwd():
-            os.chdir('..')
+        from regon_mcp_server.server import parse_arguments
         
-        try:
-            result = subprocess.run([
-                sys.executable, "regon_mcp_server/server.py", "--production", "--help"
-            ], capture_output=True, text=True, timeout=10)
-            
-            # Should not fail due to --production flag
-            assert result.returncode == 0
-            
-        except subprocess.TimeoutExpired:
-            pytest.fail("Production mode help test timed out")
-        finally:
-            os.chdir(original_dir)
+        assert parse_arguments(["--production"]).production is True
+        
+        # Should not fail due to --production flag
+        with pytest.raises(SystemExit) as exit_info:
+            parse_arguments(["--production", "--help"])
+        assert exit_info.value.code == 0
+        assert "usage:" in capsys.readouterr().out
     
     @pytest.mark.stdio
     @pytest.mark.unit
-    def test_tools_config_option(self):
+    def test_tools_config_option(self, capsys):
         """Test that tools configuration option works."""
-        original_dir = os.getcwd()
-        if 'tests' in os.getcwd():
-            os.chdir('..')
+        from regon_mcp_server.server import parse_arguments
         
-        try:
-            result = subprocess.run([
-                sys.executable, "regon_mcp_server/server.py", 
-                "--tools-config", "minimal", "--help"
-            ], capture_output=True, text=True, timeout=10)
-            
-            assert result.returncode == 0
-            
-        except subprocess.TimeoutExpired:
-            pytest.fail("Tools config test timed out")
-        finally:
-            os.chdir(original_dir)
+        assert parse_arguments(["--tools-config", "minimal"]).tools_config == "minimal"
+        
+        with pytest.raises(SystemExit) as exit_info:
+            parse_arguments(["--tools-config", "minimal", "--help"])
+        assert exit_info.value.code == 0
+        assert "usage:" in capsys.readouterr().out
+    
+    @pytest.mark.stdio
+    @pytest.mark.unit
+    @pytest.mark.parametrize("name", ["Polish", " polish ", "POLISH"])
+    def test_tools_config_name_is_canonicalized(self, name, project_root_path):
+        """Test that mixed-case and padded config names resolve to the same config."""
+        from regon_mcp_server.tool_config import ToolConfigLoader
+        
+        loader = ToolConfigLoader(str(project_root_path / "config"))
+        
+        info = loader.get_config_info(name)
+        assert info is not None
+        assert info["language"] == "pl"
+        assert loader.load_config(name)["language"] == "pl"
     
     @pytest.mark.stdio
     @pytest.mark.unit
@@ -206,10 +206,16 @@ class ExecutableBuilder:
     
     def _check_source_files(self) -> None:
         """Validate that all required source files exist."""
+        # One directory listing instead of a stat per required file
+        try:
+            with os.scandir(self.source_dir) as entries:
+                present = {entry.name for entry in entries}
+        except FileNotFoundError:
+            present = set()
+        
         for file_name in self.REQUIRED_FILES:
-            file_path = self.source_dir / file_name
-            if not file_path.exists():
-                raise FileNotFoundError(f"Required source file not found: {file_path}")
+            if file_name not in present:
+                raise FileNotFoundError(f"Required source file not found: {self.source_dir / file_name}")
     
     def _check_config_directory(self) -> None:
         """Validate config directory exists and contains files."""